@@ -1,20 +1,25 @@
 # External imports
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import networkx as nx
-import pandas as pd
 from loguru import logger
 
+# Internal imports
 from src.models import Drug, Publication
+from src.pipeline.cache import parquet_cache
 
-# Internal imports
-from src.pipeline.extractors import ClinicalTrialExtractor, DrugExtractor, PublicationExtractor
-from src.pipeline.transformers import DrugMentionGraphTransformer
-from src.utils import save_graph_to_json, visualize_graph
+# networkx, pandas, plotly and pydantic, and the modules built on them, are imported by the
+# tasks that need them, so that importing this module stays cheap
+if TYPE_CHECKING:
+    import networkx as nx
 
 
 # Task 1: Extract drug data
+@parquet_cache(Drug)
 def extract_drugs(drug_path: Path = Path("data/input/drugs.csv")) -> List[Drug]:
     """
     Extract drug data from CSV file.
@@ -25,13 +30,16 @@ def extract_drugs(drug_path: Path = Path("data/input/drugs.csv")) -> List[Drug]:
     Returns:
         List of Drug models
     """
+    from src.pipeline.extractors import DrugExtractor
+
     logger.info(f"Extracting drug data from {drug_path}")
     drug_extractor = DrugExtractor(drug_path)
     return drug_extractor.extract()
 
 
 # Task 2: Extract PubMed data from CSV
-def extract_pubmed_csv(pubmed_csv_path: Path = Path("data/input/pubmed.csv")) -> pd.DataFrame:
+@parquet_cache(Publication)
+def extract_pubmed_csv(pubmed_csv_path: Path = Path("data/input/pubmed.csv")) -> List[Publication]:
     """
     Extract PubMed data from CSV file.
 
@@ -39,15 +47,20 @@ def extract_pubmed_csv(pubmed_csv_path: Path = Path("data/input/pubmed.csv")) ->
         pubmed_csv_path: Path to the PubMed CSV file
 
     Returns:
-        DataFrame containing PubMed data from CSV
+        List of Publication models from CSV
     """
+    from src.pipeline.extractors import PublicationExtractor
+
     logger.info(f"Extracting PubMed data from CSV: {pubmed_csv_path}")
     pubmed_csv_extractor = PublicationExtractor(pubmed_csv_path)
     return pubmed_csv_extractor.extract("csv")
 
 
 # Task 3: Extract PubMed data from JSON
-def extract_pubmed_json(pubmed_json_path: Path = Path("data/input/pubmed.json")) -> pd.DataFrame:
+@parquet_cache(Publication)
+def extract_pubmed_json(
+    pubmed_json_path: Path = Path("data/input/pubmed.json"),
+) -> List[Publication]:
     """
     Extract PubMed data from JSON file.
 
@@ -55,17 +68,20 @@ def extract_pubmed_json(pubmed_json_path: Path = Path("data/input/pubmed.json"))
         pubmed_json_path: Path to the PubMed JSON file
 
     Returns:
-        DataFrame containing PubMed data from JSON
+        List of Publication models from JSON
     """
+    from src.pipeline.extractors import PublicationExtractor
+
     logger.info(f"Extracting PubMed data from JSON: {pubmed_json_path}")
     pubmed_json_extractor = PublicationExtractor(pubmed_json_path)
     return pubmed_json_extractor.extract("json")
 
 
 # Task 4: Extract clinical trials data
+@parquet_cache(Publication)
 def extract_clinical_trials(
     clinical_trials_path: Path = Path("data/input/clinical_trials.csv"),
-) -> pd.DataFrame:
+) -> List[Publication]:
     """
     Extract clinical trials data from CSV file.
 
@@ -73,8 +89,10 @@ def extract_clinical_trials(
         clinical_trials_path: Path to the clinical trials CSV file
 
     Returns:
-        DataFrame containing clinical trials data
+        List of Publication models from clinical trials
     """
+    from src.pipeline.extractors import ClinicalTrialExtractor
+
     logger.info(f"Extracting clinical trials data from {clinical_trials_path}")
     clinical_trials_extractor = ClinicalTrialExtractor(clinical_trials_path)
     return clinical_trials_extractor.extract()
@@ -95,7 +113,8 @@ def combine_pubmed_data(
         Combined list of Publication models
     """
     logger.info("Combining PubMed data from CSV and JSON sources")
-    return pubmed_csv_list + pubmed_json_list
+    # Built in one pass from both sources, without an intermediate copy
+    return list(chain(pubmed_csv_list, pubmed_json_list))
 
 
 # Task 6: Build drug mention graph
@@ -115,6 +134,8 @@ def build_drug_mention_graph(
     Returns:
         NetworkX DiGraph representing drug mentions
     """
+    from src.pipeline.transformers import DrugMentionGraphTransformer
+
     logger.info("Building drug mention graph")
     transformer = DrugMentionGraphTransformer()
     return transformer.build_graph(
@@ -138,6 +159,8 @@ def save_graph_json(
     Returns:
         Path to the saved JSON file
     """
+    from src.utils import save_graph_to_json
+
     logger.info(f"Saving graph to JSON: {output_path}")
     save_graph_to_json(graph, output_path)
     return output_path
@@ -157,14 +180,66 @@ def save_graph_gml(
     Returns:
         Path to the saved GML file
     """
+    import networkx as nx
+
     logger.info(f"Saving graph to GML: {output_path}")
-    nx.write_gml(graph, output_path)
+    # Same output as nx.write_gml, written through a 1 MiB buffer. No stringizer is passed:
+    # NetworkX would call it on every string value too, and all our values are strings
+    with open(output_path, "wb", buffering=1 << 20) as file:
+        for line in nx.generate_gml(graph):
+            file.write((line + "\n").encode("ascii"))
     return output_path
 
 
+# Task 9: Save graph to node-link JSON
+def save_graph_node_link(
+    graph: nx.DiGraph,
+    output_path: Path = Path("data/output/drug_mentions_graph.node_link.json"),
+) -> Path:
+    """
+    Save the drug mention graph to NetworkX node-link JSON, the internal fast-loading format.
+
+    Args:
+        graph: NetworkX DiGraph to save
+        output_path: Path where to save the node-link JSON file
+
+    Returns:
+        Path to the saved node-link JSON file
+    """
+    from src.utils import save_graph_to_node_link
+
+    logger.info(f"Saving graph to node-link JSON: {output_path}")
+    save_graph_to_node_link(graph, output_path)
+    return output_path
+
+
+# Task 10: Save analysis indices
+def save_indices(
+    graph: nx.DiGraph, graph_path: Path = Path("data/output/drug_mentions_graph.json")
+) -> Path:
+    """
+    Save the drug/journal indices used by the ad-hoc analyses next to the graph JSON.
+
+    Args:
+        graph: NetworkX DiGraph to index
+        graph_path: Path of the saved graph JSON file
+
+    Returns:
+        Path to the saved indices
+    """
+    from src.utils import save_graph_indices
+
+    logger.info(f"Saving graph indices for: {graph_path}")
+    return save_graph_indices(graph, graph_path)
+
+
 def validate_drug_data(drug_data):
+    from pydantic import TypeAdapter
+
     try:
-        drug = Drug(atccode=drug_data["atccode"], name=drug_data["drug"])
+        drug = TypeAdapter(Drug).validate_python(
+            {"atccode": drug_data["atccode"], "name": drug_data["drug"]}
+        )
         return drug
     except Exception as e:
         logger.error(f"Invalid drug data: {e}")
@@ -193,6 +268,7 @@ def run_pipeline(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
             "clinical_trials": Path("data/input/clinical_trials.csv"),
             "graph_json": Path("data/output/drug_mentions_graph.json"),
             "graph_gml": Path("data/output/drug_mentions_graph.gml"),
+            "graph_node_link": Path("data/output/drug_mentions_graph.node_link.json"),
         }
 
         if config:
@@ -208,9 +284,16 @@ def run_pipeline(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         drugs_list = extract_drugs(paths["drugs"])
 
         # Task 2-4: Extract publication data in parallel
-        pubmed_csv_list = extract_pubmed_csv(paths["pubmed_csv"])
-        pubmed_json_list = extract_pubmed_json(paths["pubmed_json"])
-        clinical_trials_list = extract_clinical_trials(paths["clinical_trials"])
+        # These reads are I/O-bound and independent, so threads are enough
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            pubmed_csv_future = executor.submit(extract_pubmed_csv, paths["pubmed_csv"])
+            pubmed_json_future = executor.submit(extract_pubmed_json, paths["pubmed_json"])
+            clinical_trials_future = executor.submit(
+                extract_clinical_trials, paths["clinical_trials"]
+            )
+            pubmed_csv_list = pubmed_csv_future.result()
+            pubmed_json_list = pubmed_json_future.result()
+            clinical_trials_list = clinical_trials_future.result()
 
         # Task 5: Combine PubMed data
         pubmed_list = combine_pubmed_data(pubmed_csv_list, pubmed_json_list)
@@ -219,11 +302,17 @@ def run_pipeline(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         graph = build_drug_mention_graph(drugs_list, pubmed_list, clinical_trials_list)
 
         # Visualize graph
+        from src.utils import visualize_graph
+
         visualize_graph(graph, store=False)
 
-        # Task 7-8: Save graph in different formats
+        # Task 7-9: Save graph in different formats
         json_path = save_graph_json(graph, paths["graph_json"])
         gml_path = save_graph_gml(graph, paths["graph_gml"])
+        node_link_path = save_graph_node_link(graph, paths["graph_node_link"])
+
+        # Task 10: Precompute the analysis indices, once the graph JSON is written
+        indices_path = save_indices(graph, json_path)
 
         logger.info("Pipeline completed successfully")
 
@@ -235,6 +324,8 @@ def run_pipeline(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
             "graph": graph,
             "json_path": json_path,
             "gml_path": gml_path,
+            "node_link_path": node_link_path,
+            "indices_path": indices_path,
         }
 
     except Exception as e:
@@ -35,10 +35,17 @@ This structure allows tracking where and when a drug has been mentioned across d
 """
 
 # External imports
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel
+# Models are slotted, frozen dataclasses rather than pydantic models: they are created in bulk
+# and only used as hashable value objects. Untrusted input can still be validated against them
+# with pydantic.TypeAdapter.
+
+# Golden-ratio constant XORed into the hash of clinical trials, so that a PubMed article and a
+# clinical trial sharing an ID land in different buckets without hashing a tuple
+_CLINICAL_TRIAL_HASH_SALT = 0x9E3779B97F4A7C15
 
 
 class PublicationType(str, Enum):
@@ -53,7 +60,8 @@ class PublicationType(str, Enum):
     CLINICAL_TRIAL = "clinical_trial"
 
 
-class Drug(BaseModel):
+@dataclass(slots=True, frozen=True, eq=False)
+class Drug:
     """
     Model representing a drug node in our graph.
 
@@ -92,7 +100,8 @@ class Drug(BaseModel):
         return self.atccode == other.atccode
 
 
-class Publication(BaseModel):
+@dataclass(slots=True, frozen=True, eq=False)
+class Publication:
     """
     Model representing a publication (PubMed article or clinical trial).
 
@@ -120,7 +129,9 @@ class Publication(BaseModel):
         Returns:
             int: The hash value based on the publication's ID and source type.
         """
-        return hash((self.id, self.source_type))
+        if self.source_type == PublicationType.CLINICAL_TRIAL:
+            return hash(self.id) ^ _CLINICAL_TRIAL_HASH_SALT
+        return hash(self.id)
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -144,7 +155,8 @@ class Publication(BaseModel):
         return is_equal
 
 
-class Journal(BaseModel):
+@dataclass(slots=True, frozen=True, eq=False)
+class Journal:
     """
     Model representing a journal that publishes articles.
 
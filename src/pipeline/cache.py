@@ -0,0 +1,146 @@
+# External imports
+import functools
+import hashlib
+import importlib.util
+import inspect
+import os
+import tempfile
+from dataclasses import fields
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, List, TypeVar
+
+from loguru import logger
+
+# pyarrow is optional: without it the extractors run on every call. It is only looked up
+# here, pandas and pyarrow are imported on first use to keep this module cheap to import.
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+T = TypeVar("T")
+
+CACHE_DIR = Path("data/cache")
+
+# Bump to invalidate every cache entry when the layout of the cache files changes
+CACHE_VERSION = 1
+
+# Root of the package holding the extractors and the models the cached functions rely on
+PACKAGE_DIR = Path(__file__).resolve().parents[1]
+
+
+@functools.lru_cache(maxsize=None)
+def _code_fingerprint(func: Callable[..., Any]) -> str:
+    """
+    Hash the code an extraction depends on: the function itself and the package modules.
+
+    Any change to the parsing or cleaning logic changes the fingerprint, so models built by
+    older code are never read back from the cache.
+
+    Args:
+        func (Callable): The cached extraction function.
+
+    Returns:
+        str: A hexadecimal digest of the code.
+    """
+    digest = hashlib.blake2b(inspect.getsource(func).encode())
+    for module_path in sorted(PACKAGE_DIR.rglob("*.py")):
+        digest.update(module_path.read_bytes())
+    return digest.hexdigest()
+
+
+def _cache_key(func: Callable[..., Any], path: Path) -> str:
+    """
+    Build the cache key of an extraction from the function, its code and its source file.
+
+    The key changes whenever the file is modified (size or mtime), the extraction code
+    changes or CACHE_VERSION is bumped, so a stale cache entry is never read back.
+
+    Args:
+        func (Callable): The cached extraction function.
+        path (Path): The source file read by the function.
+
+    Returns:
+        str: A 16 characters hexadecimal key.
+    """
+    stat = path.stat()
+    raw = (
+        f"{CACHE_VERSION}:{_code_fingerprint(func)}:{func.__module__}.{func.__qualname__}:"
+        f"{path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+    )
+    return hashlib.blake2b(raw.encode()).hexdigest()[:16]
+
+
+def parquet_cache(
+    model: type, cache_dir: Path = CACHE_DIR
+) -> Callable[[Callable[..., List[T]]], Callable[..., List[T]]]:
+    """
+    Cache the models returned by an extraction function in a Parquet file.
+
+    The first argument of the decorated function is the path of its source file, and it
+    returns a list of dataclass models. On a hit the models are rebuilt from the Parquet
+    file instead of parsing and cleaning the source again; Enum fields are stored as their
+    values.
+
+    Args:
+        model (type): Dataclass of the returned models, e.g. Drug or Publication.
+        cache_dir (Path): Directory holding the cache files.
+
+    Returns:
+        Callable: The decorator.
+    """
+    field_names = [field.name for field in fields(model)]
+    enum_fields = {
+        field.name: field.type
+        for field in fields(model)
+        if isinstance(field.type, type) and issubclass(field.type, Enum)
+    }
+
+    def decorator(func: Callable[..., List[T]]) -> Callable[..., List[T]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> List[T]:
+            if not HAS_PYARROW:
+                return func(*args, **kwargs)
+
+            import pandas as pd
+
+            # The source path may be passed by keyword or left to its default
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            path = Path(next(iter(bound.arguments.values())))
+
+            cache_file = cache_dir / f"{_cache_key(func, path)}.parquet"
+            if cache_file.exists():
+                logger.info(f"Loading cached extraction of {path} from {cache_file}")
+                df = pd.read_parquet(cache_file)
+                for name, enum_type in enum_fields.items():
+                    df[name] = df[name].map(enum_type)
+                return [model(**record) for record in df.to_dict("records")]
+
+            items = func(*args, **kwargs)
+            df = pd.DataFrame(
+                [[getattr(item, name) for name in field_names] for item in items],
+                columns=field_names,
+                dtype=object,
+            )
+            for name in enum_fields:
+                df[name] = df[name].map(lambda member: member.value)
+
+            # Write to a temporary file first so a concurrent reader never sees a partial file.
+            # Its name is unique, so concurrent writers never share one either
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as tmp:
+                tmp_file = Path(tmp.name)
+                try:
+                    df.to_parquet(tmp, compression="zstd", index=False)
+                except BaseException:
+                    tmp.close()
+                    tmp_file.unlink(missing_ok=True)
+                    raise
+            os.replace(tmp_file, cache_file)
+            logger.info(f"Cached extraction of {path} to {cache_file}")
+            return items
+
+        return wrapper
+
+    return decorator
@@ -1,14 +1,357 @@
 # External imports
+import csv
 import json
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, TypedDict, cast
+from typing import Any, Iterator, List, Optional, Set, Tuple, TypedDict, Union, cast
 
 import pandas as pd
 from loguru import logger
 
 # Internal imports
 from src.models import Drug, Publication, PublicationType
+from src.utils.json_io import loads_json
+
+# pyarrow is optional, CSV files are read with pandas when it is not installed
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# ijson is optional, JSON inputs are streamed with it and read whole when it is missing
+try:
+    import ijson
+
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Number of records turned into a DataFrame at once, bounds peak memory on large inputs
+CHUNK_SIZE = 10_000
+
+# JSON Lines files from this size on are parsed and cleaned by one process per CPU; below it,
+# starting the processes costs more than it saves
+PARALLEL_MIN_JSONL_BYTES = 64 << 20
+
+# Size of the byte ranges of a JSON Lines file handed to each parallel task
+JSONL_TASK_BYTES = 8 << 20
+
+# Date formats accepted in publication and clinical trial data, tried in this order:
+# YYYY-MM-DD, DD/MM/YYYY and D Month YYYY (e.g. "1 January 2020")
+_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d %B %Y")
+
+# Trailing comma before a closing bracket or brace, a common defect of hand-edited JSON
+_TRAILING_COMMA_RE = re.compile(rb",(\s*[\]}])")
+
+# Trailing comma after the last record of a JSON array, the case seen in the PubMed exports
+_FINAL_TRAILING_COMMA_RE = re.compile(rb",\s*\]\s*\Z")
+
+# Size of the end of a JSON file checked for a final trailing comma
+_JSON_TAIL_BYTES = 4096
+
+
+def _read_csv_chunks(input_path: Path) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV file as a sequence of DataFrames where every column holds strings.
+
+    With pyarrow installed, the file is streamed through Arrow's multithreaded CSV reader one
+    record batch at a time and the columns stay Arrow-backed. Otherwise pandas reads it in
+    chunks of CHUNK_SIZE rows.
+
+    Args:
+        input_path (Path): Path to the CSV file.
+
+    Yields:
+        pd.DataFrame: Raw data chunk.
+    """
+    if not HAS_PYARROW:
+        yield from pd.read_csv(input_path, dtype=str, chunksize=CHUNK_SIZE)
+        return
+
+    # Force string columns, as dtype=str does for pandas, so ids keep their leading zeros.
+    # Arrow drops a UTF-8 byte order mark from the column names, so the header must too.
+    with open(input_path, "r", encoding="utf-8-sig", newline="") as file:
+        header: List[str] = next(csv.reader(file), [])
+    convert_options = pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in header}, strings_can_be_null=True
+    )
+    with pacsv.open_csv(input_path, convert_options=convert_options) as reader:
+        for batch in reader:
+            yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _chunk_records(records: List[Any]) -> Iterator[pd.DataFrame]:
+    """
+    Turn a list of records into DataFrames of at most CHUNK_SIZE rows.
+
+    At least one DataFrame is yielded, empty when there are no records.
+
+    Args:
+        records (List[Any]): The records, one dictionary each.
+
+    Yields:
+        pd.DataFrame: Raw data chunk.
+    """
+    # Convert slices of records so the whole file is never held twice
+    for start in range(0, max(len(records), 1), CHUNK_SIZE):
+        end = start + CHUNK_SIZE
+        yield pd.DataFrame(records[start:end])
+
+
+def _jsonl_byte_ranges(input_path: Path, range_size: int) -> List[Tuple[int, int]]:
+    """
+    Split a JSON Lines file into byte ranges of about range_size bytes, cut at line ends.
+
+    Args:
+        input_path (Path): Path to the JSON Lines file.
+        range_size (int): Target size of a range, in bytes.
+
+    Returns:
+        List[Tuple[int, int]]: The (start, end) offsets of the ranges, in file order.
+    """
+    file_size = input_path.stat().st_size
+    ranges: List[Tuple[int, int]] = []
+    with open(input_path, "rb") as file:
+        start = 0
+        while start < file_size:
+            file.seek(min(start + range_size, file_size))
+            file.readline()  # Move the cut to the end of the current line
+            end = min(file.tell(), file_size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _clean_jsonl_range(task: Tuple[Path, int, int]) -> Optional[pd.DataFrame]:
+    """
+    Parse and clean the publications of a byte range of a JSON Lines file.
+
+    Runs in a worker process of _read_jsonl_parallel.
+
+    Args:
+        task (Tuple[Path, int, int]): Path to the file, start and end offsets of the range.
+
+    Returns:
+        Optional[pd.DataFrame]: Cleaned publication data, None if the range holds no record.
+    """
+    input_path, start, end = task
+    with open(input_path, "rb") as file:
+        file.seek(start)
+        content = file.read(end - start)
+
+    records = [loads_json(line) for line in content.splitlines() if line.strip()]
+    if not records:
+        return None
+    return _clean_publication_data(pd.DataFrame(records))
+
+
+def _read_jsonl_parallel(
+    input_path: Path, task_bytes: int = JSONL_TASK_BYTES
+) -> Iterator[pd.DataFrame]:
+    """
+    Parse and clean a JSON Lines publication file with one process per CPU.
+
+    JSON decoding and cleaning are CPU-bound, so the file is split into byte ranges of
+    task_bytes handed to a process pool. Results are collected in order: the chunks
+    hold the same rows, in the same order, as a sequential read.
+
+    Args:
+        input_path (Path): Path to the JSON Lines file.
+        task_bytes (int): Size of the byte range of each task. Defaults to JSONL_TASK_BYTES.
+
+    Yields:
+        pd.DataFrame: Cleaned publication data chunk.
+    """
+    tasks = [(input_path, start, end) for start, end in _jsonl_byte_ranges(input_path, task_bytes)]
+
+    found = False
+    with ProcessPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        for df in executor.map(_clean_jsonl_range, tasks):
+            if df is not None:
+                found = True
+                yield df
+
+    # A file without records fails the same way as with a sequential read
+    if not found:
+        yield _clean_publication_data(pd.DataFrame())
+
+
+@contextmanager
+def _map_file(input_path: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    Map a file in memory, read-only, instead of copying its content into a bytes object.
+
+    The mapping reads the pages straight from the OS page cache. An empty file cannot be
+    mapped and gives empty bytes.
+
+    Args:
+        input_path (Path): Path to the file.
+
+    Yields:
+        Union[bytes, mmap.mmap]: The content of the file, valid until the context exits.
+    """
+    with open(input_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _needs_json_fixes(input_path: Path) -> bool:
+    """
+    Tell whether a JSON array ends with a trailing comma after its last record.
+
+    Only the last _JSON_TAIL_BYTES of the mapped file are checked, so the known defect is
+    read whole at once instead of being streamed up to its end first. Other defects are
+    left to the fallback of _stream_json_chunks.
+
+    Args:
+        input_path (Path): Path to the JSON file.
+
+    Returns:
+        bool: True if the file needs fixing before it can be parsed.
+    """
+    with _map_file(input_path) as content:
+        return _FINAL_TRAILING_COMMA_RE.search(content[-_JSON_TAIL_BYTES:]) is not None
+
+
+def _parse_dates(dates: pd.Series) -> pd.Series:
+    """
+    Parse a column of date strings in multiple formats to standardized timestamps.
+
+    Each format of _DATE_FORMATS is tried on the whole column at once, and only the values
+    still unparsed are filled from the next format.
+
+    Args:
+        dates (pd.Series): Date strings to parse
+
+    Returns:
+        pd.Series: Parsed and standardized dates
+
+    Raises:
+        ValueError: If a date string doesn't match any supported format
+    """
+    first_format, *other_formats = _DATE_FORMATS
+    parsed = pd.to_datetime(dates, format=first_format, errors="coerce")
+    for fmt in other_formats:
+        parsed = parsed.fillna(pd.to_datetime(dates, format=fmt, errors="coerce"))
+
+    # Missing (null or empty) dates stay missing, only the values left unparsed are reported
+    unparsed = parsed.isna() & (dates.fillna("") != "")
+    if unparsed.any():
+        date_str = dates[unparsed].iloc[0]
+        logger.error(f"Date '{date_str}' doesn't match any supported format")
+        raise ValueError(f"Unsupported date format for: {date_str}")
+    return parsed
+
+
+def _clean_publication_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Clean and validate publication data.
+
+    This function performs several data quality checks and cleaning operations:
+    - Validates presence of required columns
+    - Removes rows with missing or invalid IDs
+    - Standardizes date formats
+    - Removes duplicate entries
+    - Resets the DataFrame index
+
+    Args:
+        df (pd.DataFrame): Raw publication data
+
+    Returns:
+        pd.DataFrame: Cleaned and validated publication data
+
+    Raises:
+        ValueError: If required columns are missing
+    """
+    required_columns = ["id", "title", "date", "journal"]
+
+    # Validate required columns
+    missing_cols = [col for col in required_columns if col not in df.columns]
+    if missing_cols:
+        raise ValueError(f"Missing required columns: {missing_cols}")
+
+    # Clean text fields as whole columns, so no row needs stripping later on
+    df = df.assign(
+        id=df["id"].fillna("").astype(str).str.strip(),  # JSON ids may be numbers
+        title=df["title"].fillna("").str.strip(),
+        journal=df["journal"].fillna("").str.strip(),
+    )
+
+    # Remove invalid entries
+    df = df[df["id"] != ""]
+
+    # Parse dates
+    try:
+        df = df.assign(date=_parse_dates(df["date"]))
+        logger.info(f"Successfully parsed {len(df)} dates")
+    except ValueError as e:
+        logger.error(f"Failed to parse some dates: {e}")
+        raise
+
+    # Remove duplicates and reset index
+    df = df.drop_duplicates(subset=["id"]).reset_index(drop=True)
+
+    logger.info(f"Cleaned publication data: {len(df)} valid records")
+    return df
+
+
+def _dedupe_and_format(frames: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """
+    Drop the ids already seen in previous chunks and format the dates of cleaned chunks.
+
+    Args:
+        frames (Iterator[pd.DataFrame]): Cleaned data chunks, with parsed dates.
+
+    Yields:
+        pd.DataFrame: Non-empty data chunk, with dates formatted as YYYY-MM-DD strings.
+    """
+    seen_ids: Set[str] = set()
+    for df in frames:
+        # Duplicates may be spread over several chunks
+        df = df[~df["id"].isin(seen_ids)]
+        seen_ids.update(df["id"])
+        if df.empty:
+            continue
+        # Text fields are stripped during cleaning, only dates are left to format.
+        # Missing dates are kept as "NaT", the string str() gives for a missing timestamp
+        yield df.assign(date=df["date"].dt.strftime("%Y-%m-%d").fillna("NaT"))
+
+
+def _build_publications(
+    df: pd.DataFrame, title_column: str, source_type: PublicationType
+) -> Iterator[Publication]:
+    """
+    Build Publication models from the columns of a formatted data chunk.
+
+    Whole columns are zipped, no Series is built per row.
+
+    Args:
+        df (pd.DataFrame): Data chunk with id, date, journal and title columns.
+        title_column (str): Name of the title column.
+        source_type (PublicationType): Source type of every publication of the chunk.
+
+    Yields:
+        Publication: One model per row.
+    """
+    for id_, title, date, journal in zip(
+        df["id"].to_numpy(),
+        df[title_column].to_numpy(),
+        df["date"].to_numpy(),
+        df["journal"].to_numpy(),
+    ):
+        yield Publication(
+            id=id_, title=title, date=date, journal_name=journal, source_type=source_type
+        )
 
 
 class DataExtractor:
@@ -44,7 +387,7 @@ class DataExtractor:
     #     data source checks, including format, encoding, and data quality checks.
     #     Some very basic checks are implemented, but other should be implemented in
     #     subclasses in functions of goals of the specific data source.
-    #     For example, the PublicationExtractor has a _clean_publication_data method
+    #     For example, the PublicationExtractor relies on _clean_publication_data
     #     that cleans the data and validates the data.
     #     Further verifications can be performed using field_validator
     #     from pydantic in schemas.py.
@@ -89,10 +432,21 @@ class DrugExtractor(DataExtractor):
         """
         self.validate_file_exists()
         try:
-            df = pd.read_csv(self.input_path, dtype=str)
-            drugs = [
-                Drug(atccode=row["atccode"], name=row["drug"].strip()) for _, row in df.iterrows()
-            ]
+            drugs: List[Drug] = []
+            for df in _read_csv_chunks(self.input_path):
+                # Whole columns are stripped and zipped, no Series is built per row
+                atccodes = df["atccode"].fillna("")
+                names = df["drug"].fillna("").str.strip()
+                # An empty name would match every title, so missing values are rejected
+                missing = (atccodes == "") | (names == "")
+                if missing.any():
+                    raise ValueError(
+                        f"Missing atccode or drug name for drug: {atccodes[missing].iloc[0]!r}"
+                    )
+                drugs.extend(
+                    Drug(atccode=atccode, name=name)
+                    for atccode, name in zip(atccodes.to_numpy(), names.to_numpy())
+                )
             return drugs
         except Exception as e:
             logger.error(f"Error extracting drug data: {str(e)}")
@@ -127,146 +481,248 @@ class PublicationExtractor(DataExtractor):
         - D Month YYYY (e.g., "1 January 2020")
     """
 
+    def __init__(
+        self,
+        input_path: Path,
+        parallel_min_jsonl_bytes: int = PARALLEL_MIN_JSONL_BYTES,
+        jsonl_task_bytes: int = JSONL_TASK_BYTES,
+    ):
+        """
+        Initialize the PublicationExtractor with a file path.
+
+        Args:
+            input_path (Path): Path to the input file to be processed.
+            parallel_min_jsonl_bytes (int): Size from which a JSON Lines file is parsed and
+                cleaned in worker processes. Defaults to PARALLEL_MIN_JSONL_BYTES.
+            jsonl_task_bytes (int): Size of the byte range handed to each worker process.
+                Defaults to JSONL_TASK_BYTES.
+        """
+        super().__init__(input_path)
+        self.parallel_min_jsonl_bytes = parallel_min_jsonl_bytes
+        self.jsonl_task_bytes = jsonl_task_bytes
+
     def extract(self, file_type: str) -> List[Publication]:
         """
         Extract and validate publication data from CSV or JSON sources and return as a list of Publication models.
 
+        Args:
+            file_type (str): "csv", "json" (an array of records) or "jsonl" (one record per line).
+
         Returns:
             List[Publication]: A list of Publication model instances.
         """
         self.validate_file_exists()
         try:
-            if file_type == "csv":
-                df = pd.read_csv(self.input_path, dtype=str)
-            elif file_type == "json":
-                data = self._read_json_safely()
-                df = pd.DataFrame(data)
-
-            df = self._clean_publication_data(df)
-            publications = [
-                Publication(
-                    id=str(row["id"]),
-                    title=row["title"].strip(),
-                    date=str(row["date"].date()),
-                    journal_name=row["journal"].strip(),
-                    source_type=PublicationType.PUBMED,
-                )
-                for _, row in df.iterrows()
-            ]
+            publications: List[Publication] = []
+            for df in self._read_publication_frames(file_type):
+                publications.extend(_build_publications(df, "title", PublicationType.PUBMED))
             return publications
         except Exception as e:
             logger.error(f"Error extracting publication data from {self.input_path}: {str(e)}")
             raise
 
-    def _read_json_safely(self) -> List[PublicationData]:
+    def extract_table(self, file_type: str) -> "pa.Table":
         """
-        Safely read and parse JSON data, handling common formatting issues.
+        Extract publication data as a columnar Arrow table instead of Publication models.
 
-        This method attempts to read JSON data and includes error correction for
-        common JSON formatting issues like trailing commas. It provides a robust
-        way to handle potentially malformed JSON files.
+        The table holds the same publications, in the same order, as extract(). Its columns
+        are the Publication fields, with journal_name and source_type dictionary-encoded.
+        It suits bulk processing, where building one model per publication is not needed.
+
+        Args:
+            file_type (str): "csv", "json" (an array of records) or "jsonl" (one record per line).
 
         Returns:
-            List[Dict]: List of dictionaries containing the parsed JSON data
+            pa.Table: Table with id, title, date, journal_name and source_type columns.
 
         Raises:
-            json.JSONDecodeError: If the JSON cannot be parsed even after fixes
+            ImportError: If pyarrow is not installed.
         """
-        with open(self.input_path, "r", encoding="utf-8") as file:
-            content = file.read()
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow is required to extract publications as an Arrow table")
 
-        # Try parsing as-is first
+        self.validate_file_exists()
         try:
-            return cast(List[PublicationData], json.loads(content))
-        except json.JSONDecodeError as e:
-            logger.warning(f"Initial JSON parsing failed: {e}. Attempting fixes...")
+            text = pa.string()
+            categorical = pa.dictionary(pa.int32(), pa.string())
+            schema = pa.schema(
+                [
+                    ("id", text),
+                    ("title", text),
+                    ("date", text),
+                    ("journal_name", categorical),
+                    ("source_type", categorical),
+                ]
+            )
+            source_type = PublicationType.PUBMED.value
+
+            tables = [
+                pa.table(
+                    [
+                        pa.array(df["id"].to_numpy(), type=text),
+                        pa.array(df["title"].to_numpy(), type=text),
+                        pa.array(df["date"].to_numpy(), type=text),
+                        pa.array(df["journal"].to_numpy(), type=text).cast(categorical),
+                        pa.repeat(pa.scalar(source_type, text), len(df)).cast(categorical),
+                    ],
+                    schema=schema,
+                )
+                for df in self._read_publication_frames(file_type)
+            ]
+            return pa.concat_tables(tables) if tables else schema.empty_table()
+        except Exception as e:
+            logger.error(f"Error extracting publication data from {self.input_path}: {str(e)}")
+            raise
 
-        # Apply fixes for common JSON issues
-        fixed_content = re.sub(r",(\s*[\]}])", r"\1", content)
+    def _read_publication_frames(self, file_type: str) -> Iterator[pd.DataFrame]:
+        """
+        Read the input file as cleaned, deduplicated DataFrames with formatted dates.
 
-        try:
-            logger.info("JSON successfully fixed and parsed")
-            return cast(List[PublicationData], json.loads(fixed_content))
-        except json.JSONDecodeError as e:
-            logger.error(f"Could not fix JSON: {e}")
-            raise
+        Args:
+            file_type (str): One of "csv", "json" or "jsonl".
+
+        Yields:
+            pd.DataFrame: Publication data chunk, with id, title, date and journal columns.
+        """
+        yield from _dedupe_and_format(self._read_clean_chunks(file_type))
 
-    def _parse_date(self, date_str: str) -> pd.Timestamp:
+    def _read_clean_chunks(self, file_type: str) -> Iterator[pd.DataFrame]:
         """
-        Parse date strings in multiple formats to a standardized timestamp.
+        Read the input file as a sequence of cleaned DataFrames.
 
-        This method attempts to parse dates in various formats, providing flexibility
-        in handling different date representations in the input data.
+        Large JSON Lines files are parsed and cleaned in parallel, other files chunk by chunk.
 
         Args:
-            date_str (str): Date string to parse
+            file_type (str): One of "csv", "json" or "jsonl".
 
-        Returns:
-            pd.Timestamp: Parsed and standardized date
+        Yields:
+            pd.DataFrame: Cleaned publication data chunk.
+        """
+        if (
+            file_type == "jsonl"
+            and self.input_path.stat().st_size >= self.parallel_min_jsonl_bytes
+        ):
+            yield from _read_jsonl_parallel(self.input_path, self.jsonl_task_bytes)
+            return
+
+        for chunk in self._read_chunks(file_type):
+            yield _clean_publication_data(chunk)
+
+    def _read_chunks(self, file_type: str) -> Iterator[pd.DataFrame]:
+        """
+        Read the input file as a sequence of DataFrames of at most CHUNK_SIZE rows.
+
+        Args:
+            file_type (str): One of "csv", "json" or "jsonl".
+
+        Yields:
+            pd.DataFrame: Raw publication data chunk.
 
         Raises:
-            ValueError: If the date string doesn't match any supported format
+            ValueError: If the file type is not supported.
         """
-        formats = [
-            ("%Y-%m-%d", "YYYY-MM-DD"),
-            ("%d/%m/%Y", "DD/MM/YYYY"),
-            ("%d %B %Y", "D Month YYYY"),
-        ]
+        if file_type == "csv":
+            yield from _read_csv_chunks(self.input_path)
+        elif file_type == "json":
+            if HAS_IJSON and not _needs_json_fixes(self.input_path):
+                yield from self._stream_json_chunks()
+            else:
+                yield from _chunk_records(self._read_json_safely())
+        elif file_type == "jsonl":
+            yield from self._read_jsonl_chunks()
+        else:
+            raise ValueError(f"Unsupported file type: {file_type}")
+
+    def _stream_json_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Stream the records of a JSON array with ijson, CHUNK_SIZE records at a time.
 
-        for fmt, _ in formats:
-            try:
-                return pd.to_datetime(date_str, format=fmt)
-            except ValueError:
-                continue
+        Only one chunk of records is held in memory instead of the whole document. If the
+        stream hits malformed JSON, the file is read whole with _read_json_safely, which
+        fixes common issues, and the records not yielded yet are yielded from there.
 
-        logger.error(f"Date '{date_str}' doesn't match any supported format")
-        raise ValueError(f"Unsupported date format for: {date_str}")
+        Yields:
+            pd.DataFrame: Raw publication data chunk.
+        """
+        yielded = 0
+        batch: List[Any] = []
+        try:
+            with open(self.input_path, "rb") as file:
+                for record in ijson.items(file, "item", use_float=True):
+                    batch.append(record)
+                    if len(batch) == CHUNK_SIZE:
+                        yield pd.DataFrame(batch)
+                        yielded += len(batch)
+                        batch = []
+        except ijson.JSONError as e:
+            logger.warning(f"Streaming JSON parsing failed: {e}. Reading the whole file...")
+            yield from _chunk_records(self._read_json_safely()[yielded:])
+            return
+
+        if batch or not yielded:
+            yield pd.DataFrame(batch)
+
+    def _read_jsonl_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Read a JSON Lines file, one record per line, CHUNK_SIZE records at a time.
+
+        Each line is parsed on its own, so only one chunk of records is held in memory.
+        Blank lines are skipped.
+
+        Yields:
+            pd.DataFrame: Raw publication data chunk.
 
-    def _clean_publication_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        Raises:
+            json.JSONDecodeError: If a line is not valid JSON
         """
-        Clean and validate publication data.
+        yielded = 0
+        batch: List[Any] = []
+        with open(self.input_path, "rb") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                batch.append(loads_json(line))
+                if len(batch) == CHUNK_SIZE:
+                    yield pd.DataFrame(batch)
+                    yielded += len(batch)
+                    batch = []
+
+        if batch or not yielded:
+            yield pd.DataFrame(batch)
 
-        This method performs several data quality checks and cleaning operations:
-        - Validates presence of required columns
-        - Removes rows with missing or invalid IDs
-        - Standardizes date formats
-        - Removes duplicate entries
-        - Resets the DataFrame index
+    def _read_json_safely(self) -> List[PublicationData]:
+        """
+        Safely read and parse JSON data, handling common formatting issues.
 
-        Args:
-            df (pd.DataFrame): Raw publication data
+        This method attempts to read JSON data and includes error correction for
+        common JSON formatting issues like trailing commas. It provides a robust
+        way to handle potentially malformed JSON files.
 
         Returns:
-            pd.DataFrame: Cleaned and validated publication data
+            List[Dict]: List of dictionaries containing the parsed JSON data
 
         Raises:
-            ValueError: If required columns are missing
+            json.JSONDecodeError: If the JSON cannot be parsed even after fixes
         """
-        required_columns = ["id", "title", "date", "journal"]
-
-        # Validate required columns
-        missing_cols = [col for col in required_columns if col not in df.columns]
-        if missing_cols:
-            raise ValueError(f"Missing required columns: {missing_cols}")
+        # Map the file rather than reading it: orjson parses the mapped bytes directly,
+        # without decoding to str first, and the fixes read them without a copy either
+        with _map_file(self.input_path) as content:
+            # Try parsing as-is first
+            try:
+                return cast(List[PublicationData], loads_json(content))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Initial JSON parsing failed: {e}. Attempting fixes...")
 
-        # Clean and validate data
-        df = df[df["id"].notna() & (df["id"] != "")]
-        df["id"] = df["id"].astype(str)
+            # Apply fixes for common JSON issues
+            fixed_content = _TRAILING_COMMA_RE.sub(rb"\1", content)
 
-        # Parse dates
         try:
-            df["date"] = df["date"].apply(self._parse_date)
-            logger.info(f"Successfully parsed {len(df)} dates")
-        except ValueError as e:
-            logger.error(f"Failed to parse some dates: {e}")
+            logger.info("JSON successfully fixed and parsed")
+            return cast(List[PublicationData], loads_json(fixed_content))
+        except json.JSONDecodeError as e:
+            logger.error(f"Could not fix JSON: {e}")
             raise
 
-        # Remove duplicates and reset index
-        df = df.drop_duplicates(subset=["id"]).reset_index(drop=True)
-
-        logger.info(f"Cleaned publication data: {len(df)} valid records")
-        return df
-
 
 class ClinicalTrialExtractor(DataExtractor):
     """
@@ -296,18 +752,15 @@ class ClinicalTrialExtractor(DataExtractor):
         """
         self.validate_file_exists()
         try:
-            df = pd.read_csv(self.input_path, dtype=str)
-            df = self._clean_clinical_trial_data(df)
-            clinical_trials = [
-                Publication(
-                    id=str(row["id"]),
-                    title=row["scientific_title"].strip(),
-                    date=str(row["date"].date()),
-                    journal_name=row["journal"].strip(),
-                    source_type=PublicationType.CLINICAL_TRIAL,
+            clinical_trials: List[Publication] = []
+            frames = (
+                self._clean_clinical_trial_data(chunk)
+                for chunk in _read_csv_chunks(self.input_path)
+            )
+            for df in _dedupe_and_format(frames):
+                clinical_trials.extend(
+                    _build_publications(df, "scientific_title", PublicationType.CLINICAL_TRIAL)
                 )
-                for _, row in df.iterrows()
-            ]
             return clinical_trials
         except Exception as e:
             logger.error(f"Error extracting clinical trials data: {str(e)}")
@@ -340,25 +793,19 @@ class ClinicalTrialExtractor(DataExtractor):
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
 
-        # Clean data
-        df = df[
-            df["id"].notna()
-            & (df["id"] != "")
-            & df["scientific_title"].notna()
-            & (df["scientific_title"].str.strip() != "")
-        ]
-
-        # Clean text fields
-        df["scientific_title"] = df["scientific_title"].str.strip()
-        df["id"] = df["id"].astype(str)
-        df["journal"] = df["journal"].fillna("").str.strip()
+        # Clean text fields as whole columns, so no row needs stripping later on
+        df = df.assign(
+            id=df["id"].fillna("").astype(str).str.strip(),
+            scientific_title=df["scientific_title"].fillna("").str.strip(),
+            journal=df["journal"].fillna("").str.strip(),
+        )
 
         # Remove invalid entries
-        df = df[df["journal"] != ""]
+        df = df[(df["id"] != "") & (df["scientific_title"] != "") & (df["journal"] != "")]
 
         # Parse dates
         try:
-            df["date"] = df["date"].apply(self._parse_date)
+            df = df.assign(date=_parse_dates(df["date"]))
             logger.info(f"Successfully parsed {len(df)} dates")
         except ValueError as e:
             logger.error(f"Failed to parse some dates: {e}")
@@ -369,36 +816,3 @@ class ClinicalTrialExtractor(DataExtractor):
 
         logger.info(f"Cleaned clinical trials data: {len(df)} valid records")
         return df
-
-    def _parse_date(self, date_str: str) -> pd.Timestamp:
-        """
-        Parse date strings in multiple formats to a standardized timestamp.
-
-        Supports multiple date formats commonly found in clinical trial data:
-        - YYYY-MM-DD
-        - DD/MM/YYYY
-        - D Month YYYY
-
-        Args:
-            date_str (str): Date string to parse
-
-        Returns:
-            pd.Timestamp: Parsed and standardized date
-
-        Raises:
-            ValueError: If the date string doesn't match any supported format
-        """
-        formats = [
-            ("%Y-%m-%d", "YYYY-MM-DD"),
-            ("%d/%m/%Y", "DD/MM/YYYY"),
-            ("%d %B %Y", "D Month YYYY"),
-        ]
-
-        for fmt, _ in formats:
-            try:
-                return pd.to_datetime(date_str, format=fmt)
-            except ValueError:
-                continue
-
-        logger.error(f"Date '{date_str}' doesn't match any supported format")
-        raise ValueError(f"Unsupported date format for: {date_str}")
@@ -1,13 +1,175 @@
 # External imports
-from typing import List
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Dict, Iterator, List, Set, Tuple
 
 import networkx as nx
 import pandas as pd
 from loguru import logger
 
+# pyahocorasick is optional: without it, mentions are found with a substring scan per drug
+try:
+    import ahocorasick
+
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 # Internal imports
 from src.models import Drug, Journal, Publication, PublicationType
 
+# Columns of DrugMentionGraphTransformer.mentions
+MENTION_COLUMNS = ["drug", "pub", "journal", "date"]
+
+# Number of publications from which mention matching is spread over worker processes;
+# below it, starting the processes costs more than the scan itself
+PARALLEL_MIN_PUBLICATIONS = 100_000
+
+
+# Node IDs are interned so that the many dict lookups NetworkX performs on them compare by
+# identity instead of character by character. They stay strings: they are the keys used by
+# the GML/JSON outputs and by the ad-hoc analyses.
+def _drug_node_id(drug: Drug) -> str:
+    """Return the graph node ID of a drug: its lowercase name."""
+    return sys.intern(drug.name.lower())
+
+
+def _publication_node_id(pub: Publication) -> str:
+    """Return the graph node ID of a publication: its lowercase title truncated to 20 chars."""
+    return sys.intern(pub.title[:20].lower())
+
+
+def _journal_node_id(journal_name: str) -> str:
+    """Return the graph node ID of a journal: its name truncated to 20 chars."""
+    return sys.intern(journal_name[:20])
+
+
+def _find_mentions_substring(
+    drug_names: List[str], titles: List[str]
+) -> Iterator[Tuple[int, int]]:
+    """
+    Find the drugs mentioned in publication titles with a substring scan.
+
+    Args:
+        drug_names (List[str]): Lowercase drug names.
+        titles (List[str]): Lowercase publication titles.
+
+    Yields:
+        Tuple[int, int]: Index of a drug and index of a title that mentions it,
+        in title order for each drug.
+    """
+    for drug_index, name in enumerate(drug_names):
+        for pub_index, title in enumerate(titles):
+            # This is a naive approach, we should use a more sophisticated approach
+            # to connect drugs to publications, example:
+            # 'Amphetamine' in 'Dextroamphetamine' would give True
+            if name in title:
+                yield drug_index, pub_index
+
+
+def _find_mentions_aho_corasick(
+    drug_names: List[str], titles: List[str]
+) -> Iterator[Tuple[int, int]]:
+    """
+    Find the drugs mentioned in publication titles with an Aho-Corasick automaton.
+
+    The automaton is built once over all drug names and each title is scanned
+    once, instead of once per drug. Matches are substring matches, exactly as in
+    _find_mentions_substring.
+
+    Args:
+        drug_names (List[str]): Lowercase drug names.
+        titles (List[str]): Lowercase publication titles.
+
+    Yields:
+        Tuple[int, int]: Index of a drug and index of a title that mentions it.
+    """
+    if not drug_names:
+        return
+
+    # Drugs sharing a name share a node, the last one wins as with add_node
+    automaton = ahocorasick.Automaton()
+    for drug_index, name in enumerate(drug_names):
+        automaton.add_word(name, drug_index)
+    automaton.make_automaton()
+
+    for pub_index, title in enumerate(titles):
+        # A drug can occur several times in the same title
+        mentioned = dict.fromkeys(drug_index for _, drug_index in automaton.iter(title))
+        for drug_index in mentioned:
+            yield drug_index, pub_index
+
+
+# Lowercase drug names and titles, set once in each worker process by _init_mention_worker
+_worker_drug_names: List[str] = []
+_worker_titles: List[str] = []
+
+
+def _init_mention_worker(drug_names: List[str], titles: List[str]) -> None:
+    """Store the strings to match in a worker process, so they are sent once per worker."""
+    global _worker_drug_names, _worker_titles
+    _worker_drug_names = drug_names
+    _worker_titles = titles
+
+
+def _find_mentions_in_shard(shard: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """
+    Find the mentions of one shard in a worker process.
+
+    With Aho-Corasick, a shard is a range of titles matched against every drug; with the
+    substring scan, it is a range of drugs matched against every title. Either way the
+    concatenated shards come out in the same order as a single sequential scan.
+
+    Args:
+        shard (Tuple[int, int]): Start and end of the range of titles or drugs.
+
+    Returns:
+        List[Tuple[int, int]]: Drug and title indices, relative to the full lists.
+    """
+    start, end = shard
+    if HAS_AHOCORASICK:
+        titles = _worker_titles[start:end]
+        return [
+            (drug_index, pub_index + start)
+            for drug_index, pub_index in _find_mentions_aho_corasick(_worker_drug_names, titles)
+        ]
+    drug_names = _worker_drug_names[start:end]
+    return [
+        (drug_index + start, pub_index)
+        for drug_index, pub_index in _find_mentions_substring(drug_names, _worker_titles)
+    ]
+
+
+def _find_mentions_parallel(drug_names: List[str], titles: List[str]) -> Iterator[Tuple[int, int]]:
+    """
+    Find the drugs mentioned in publication titles with one process per CPU.
+
+    Matching is pure CPU work on Python strings, so processes rather than threads are
+    needed to use several cores. Shards are collected in order: the mentions are the
+    same, in the same order, as with _find_mentions_aho_corasick or _find_mentions_substring.
+
+    Args:
+        drug_names (List[str]): Lowercase drug names.
+        titles (List[str]): Lowercase publication titles.
+
+    Yields:
+        Tuple[int, int]: Index of a drug and index of a title that mentions it.
+    """
+    workers = os.cpu_count() or 1
+    n_items = len(titles) if HAS_AHOCORASICK else len(drug_names)
+    shard_size = max(1, -(-n_items // workers))  # Ceiling division
+    shards = [(start, min(start + shard_size, n_items)) for start in range(0, n_items, shard_size)]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_mention_worker,
+        initargs=(drug_names, titles),
+    ) as executor:
+        for mentions in executor.map(_find_mentions_in_shard, shards):
+            yield from mentions
+
 
 class DrugMentionGraphTransformer:
     """
@@ -19,16 +181,27 @@ class DrugMentionGraphTransformer:
 
     Attributes:
         graph (nx.DiGraph): The directed graph representing drug mentions.
+        mentions (pd.DataFrame): One row per drug mention, with categorical 'drug', 'pub',
+            'journal' and 'date' columns holding node IDs and the mention date. Built in
+            the same pass as the edges, for queries that need no graph traversal.
+        parallel_min_publications (int): Number of publications from which mention
+            matching runs in worker processes.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, parallel_min_publications: int = PARALLEL_MIN_PUBLICATIONS) -> None:
         """
         Initialize the transformer with an empty graph.
 
         This constructor sets up an empty directed graph using NetworkX, ready to
         be populated with nodes and edges representing drug mentions.
+
+        Args:
+            parallel_min_publications (int): Number of publications from which mention
+                matching runs in worker processes. Defaults to PARALLEL_MIN_PUBLICATIONS.
         """
+        self.parallel_min_publications = parallel_min_publications
         self.graph = nx.DiGraph()
+        self.mentions = pd.DataFrame(columns=MENTION_COLUMNS, dtype="category")
 
     def build_graph(
         self,
@@ -55,8 +228,8 @@ class DrugMentionGraphTransformer:
             Exception: If an error occurs during graph construction.
         """
         try:
-            # Combine all publications
-            all_publications = pubmed_publications + clinical_trials_publications
+            # Combine all publications, they are walked several times so a list is kept
+            all_publications = list(chain(pubmed_publications, clinical_trials_publications))
 
             # For readability: Extract journals from publications
             journals = self._extract_journals(all_publications)
@@ -90,13 +263,10 @@ class DrugMentionGraphTransformer:
         Returns:
             List[Drug]: List of Drug objects.
         """
-        drugs = []
-        for _, row in drugs_df.iterrows():
-            drug = Drug(
-                atccode=row["atccode"],  # we will use this attribute in __eq__ and __hash__
-                name=row["drug"].strip(),
-            )
-            drugs.append(drug)
+        # atccode is the attribute used in __eq__ and __hash__
+        atccodes = drugs_df["atccode"].to_numpy()
+        names = drugs_df["drug"].str.strip().to_numpy()
+        drugs = [Drug(atccode=atccode, name=name) for atccode, name in zip(atccodes, names)]
 
         logger.info(f"Processed {len(drugs)} drugs")
         return drugs
@@ -121,21 +291,18 @@ class DrugMentionGraphTransformer:
         """
         publications = []
 
-        for _, row in df.iterrows():
+        # Plain tuples in a fixed column order: the title column name varies by source
+        rows = df[["id", title_column, "date", "journal"]].itertuples(index=False, name=None)
+        for id_, title, date, journal in rows:
             # Skip rows with empty IDs or titles
-            if (
-                pd.isna(row["id"])
-                or row["id"] == ""
-                or pd.isna(row[title_column])
-                or row[title_column] == ""
-            ):
+            if pd.isna(id_) or id_ == "" or pd.isna(title) or title == "":
                 continue
 
             publication = Publication(
-                id=str(row["id"]),
-                title=row[title_column].strip(),
-                date=str(row["date"]),
-                journal_name=row["journal"].strip(),
+                id=str(id_),
+                title=title.strip(),
+                date=str(date),
+                journal_name=journal.strip(),
                 source_type=source_type,
             )
             publications.append(publication)
@@ -156,13 +323,16 @@ class DrugMentionGraphTransformer:
         Returns:
             List[Journal]: List of unique Journal objects.
         """
-        journal_set = set()
+        # A dict keeps the first-seen order, so journal nodes come out in a stable order
+        journal_names: Dict[str, None] = {}
 
         for pub in publications:
-            if pub.journal_name and pub.journal_name.strip():
-                journal_set.add(pub.journal_name)
+            if pub.journal_name:
+                name = pub.journal_name.strip()
+                if name:
+                    journal_names[name] = None
 
-        journals = [Journal(name=name) for name in journal_set]
+        journals = [Journal(name=name) for name in journal_names]
         logger.info(f"Extracted {len(journals)} unique journals")
         return journals
 
@@ -180,32 +350,39 @@ class DrugMentionGraphTransformer:
             publications (List[Publication]): List of Publication objects.
             journals (List[Journal]): List of Journal objects.
         """
+        # Nodes are handed to NetworkX in one batch per type rather than one add_node call
+        # each. A repeated ID updates the attributes of the existing node, as add_node does.
+
         # Add drug nodes
-        for drug in drugs:
-            self.graph.add_node(
-                drug.name.lower(),  # Use lowercase name as node ID
-                type="drug",
-                atccode=drug.atccode,  # Store atccode as attribute
+        self.graph.add_nodes_from(
+            (
+                _drug_node_id(drug),  # Use lowercase name as node ID
+                {"type": "drug", "atccode": drug.atccode},  # Store atccode as attribute
             )
+            for drug in drugs
+        )
 
         # Add publication nodes - use truncated title as ID
-        for pub in publications:
-            pub_id = pub.title[:20].lower()  # Truncate title to 20 chars for node ID
-            self.graph.add_node(
-                pub_id,
-                type=pub.source_type,
-                id=pub.id,  # Store original ID as attribute
-                title=pub.title,  # Store full title as attribute
-                date=str(pub.date),
-                journal_name=pub.journal_name,
+        self.graph.add_nodes_from(
+            (
+                _publication_node_id(pub),  # Truncate title to 20 chars for node ID
+                {
+                    "type": pub.source_type,
+                    "id": pub.id,  # Store original ID as attribute
+                    "title": pub.title,  # Store full title as attribute
+                    "date": str(pub.date),
+                    "journal_name": pub.journal_name,
+                },
             )
+            for pub in publications
+        )
 
         # Add journal nodes - use truncated name as ID
-        for journal in journals:
-            journal_id = journal.name[:20]
-            self.graph.add_node(
-                journal_id, type="journal", name=journal.name  # Store full name as attribute
-            )
+        self.graph.add_nodes_from(
+            # Store full name as attribute
+            (_journal_node_id(journal.name), {"type": "journal", "name": journal.name})
+            for journal in journals
+        )
 
     def _connect_drugs_to_publications(
         self, drugs: List[Drug], publications: List[Publication]
@@ -221,36 +398,70 @@ class DrugMentionGraphTransformer:
             drugs (List[Drug]): List of Drug objects.
             publications (List[Publication]): List of Publication objects.
         """
-        # Track which journals have been connected to which drugs
-        drug_journal_connections = set()
-
-        for drug in drugs:
-            drug_id = drug.name.lower()
-
-            for pub in publications:
-                # Check if drug is mentioned in publication title
-                if drug.name.lower() in pub.title.lower():
-                    # This is a naive approach, we should use a more sophisticated approach
-                    # to connect drugs to publications, example:
-                    # 'Amphetamine' in 'Dextroamphetamine' would give True
-                    # Connect drug to publication - use truncated title consistently
-                    pub_id = pub.title[:20].lower()
-                    self.graph.add_edge(
-                        drug_id,
-                        pub_id,
-                        relationship="Référencé dans",
-                        date_mention=pub.date,
-                    )
-
-                    # Connect drug to journal (if not already connected)
-                    journal_id = pub.journal_name[:20]
-                    connection_key = (drug_id, journal_id)
-
-                    if connection_key not in drug_journal_connections:
-                        self.graph.add_edge(
-                            drug_id,
-                            journal_id,
-                            relationship="Référencé dans",
-                            date_mention=pub.date,
-                        )
-                        drug_journal_connections.add(connection_key)
+        # Collect edges first and add them in one batch: NetworkX per-call overhead
+        # dominates when edges are added one by one. Edges are keyed by (source, target)
+        # so a repeated mention (e.g. two titles truncated to the same node ID) only keeps
+        # its latest date, as NetworkX would, without building an attribute dict per repeat.
+        edge_dates: Dict[Tuple[str, str], str] = {}
+
+        # The matching itself only sees plain lowercase strings, lowered once here
+        drug_names = [drug.name.lower() for drug in drugs]
+        titles = [pub.title.lower() for pub in publications]
+        if len(titles) >= self.parallel_min_publications:
+            mentions = _find_mentions_parallel(drug_names, titles)
+        elif HAS_AHOCORASICK:
+            mentions = _find_mentions_aho_corasick(drug_names, titles)
+        else:
+            mentions = _find_mentions_substring(drug_names, titles)
+
+        # Node IDs are derived once per drug and per publication, not once per mention
+        drug_ids = [_drug_node_id(drug) for drug in drugs]
+        pub_rows = [
+            (_publication_node_id(pub), _journal_node_id(pub.journal_name), pub.date)
+            for pub in publications
+        ]
+
+        # Track which journals have been connected to which drugs: one set of journal IDs
+        # per drug, so a check hashes one string instead of building a (drug, journal) tuple
+        connected_journals: Dict[str, Set[str]] = {drug_id: set() for drug_id in drug_ids}
+
+        # Columns of the mentions table, filled in the same pass as the edges
+        mention_drugs: List[str] = []
+        mention_pubs: List[str] = []
+        mention_journals: List[str] = []
+        mention_dates: List[str] = []
+
+        for drug_index, pub_index in mentions:
+            drug_id = drug_ids[drug_index]
+            pub_id, journal_id, date = pub_rows[pub_index]
+            mention_drugs.append(drug_id)
+            mention_pubs.append(pub_id)
+            mention_journals.append(journal_id)
+            mention_dates.append(date)
+
+            # Connect drug to publication - use truncated title consistently
+            edge_dates[(drug_id, pub_id)] = date
+
+            # Connect drug to journal (if not already connected)
+            drug_journals = connected_journals[drug_id]
+
+            if journal_id not in drug_journals:
+                edge_dates[(drug_id, journal_id)] = date
+                drug_journals.add(journal_id)
+
+        self.graph.add_edges_from(
+            (source, target, {"relationship": "Référencé dans", "date_mention": date})
+            for (source, target), date in edge_dates.items()
+        )
+
+        # Categorical columns store each node ID once, rows only hold integer codes
+        self.mentions = pd.DataFrame(
+            {
+                "drug": mention_drugs,
+                "pub": mention_pubs,
+                "journal": mention_journals,
+                "date": mention_dates,
+            },
+            columns=MENTION_COLUMNS,
+            dtype="category",
+        )
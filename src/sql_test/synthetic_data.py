@@ -1,16 +1,19 @@
 # External imports
-import random
 from datetime import datetime
 from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 
-def fake_it(store_data: bool = False) -> Tuple[List[Dict], List[Dict]]:
+def fake_it(store_data: bool = False, seed: int = 0) -> Tuple[List[Dict], List[Dict]]:
     """
     Generate synthetic data for PRODUCT_NOMENCLATURE and TRANSACTIONS tables.
     For better results in for production testing: https://docs.sdk.ydata.ai/latest/
+    Args:
+        store_data: Whether to also write both tables to CSV files in ./data.
+        seed: Seed of the random generator, the same seed gives the same data.
     Returns:
         Tuple containing two lists of dictionaries:
         - product_nomenclature_data: List of dictionaries with product metadata.
@@ -37,40 +40,27 @@ def fake_it(store_data: bool = False) -> Tuple[List[Dict], List[Dict]]:
     start_date = datetime(2018, 12, 1)
     end_date = datetime(2020, 1, 31)
 
-    # Initialize an empty list to store transaction data
-    transaction_data = []
-    transaction_id = 1  # Initialize transaction ID counter
-    current_date = start_date  # Start from the initial date
+    # Generate transaction data with 3 transactions per month, drawing every column in
+    # one vectorized call instead of building the rows month by month
+    rng = np.random.default_rng(seed)
+    months = pd.date_range(start_date, end_date, freq="MS")  # First day of each month
+    n_transactions = len(months) * 3
+    transactions_df = pd.DataFrame(
+        {
+            # Unique identifier for the transaction
+            "transaction_id": np.arange(1, n_transactions + 1),
+            # Transaction date in YYYY-MM-DD format
+            "date": np.repeat(months.strftime("%Y-%m-%d").to_numpy(), 3),
+            "order_id": rng.integers(1000, 10000, n_transactions),  # Random order ID
+            "client_id": rng.integers(1, 51, n_transactions),  # Random client ID
+            "prod_id": rng.integers(1, 7, n_transactions),  # Random product ID
+            "prod_price": np.round(rng.uniform(5, 500, n_transactions), 2),  # Random price
+            "prod_qty": rng.integers(1, 11, n_transactions),  # Random product quantity
+        }
+    )
+    transaction_data = transactions_df.to_dict("records")
 
-    # Generate transaction data with 3 transactions per month
-    while current_date <= end_date:
-        for _ in range(3):  # Create 3 transactions for each month
-            transaction_data.append(
-                {
-                    "transaction_id": transaction_id,  # Unique identifier for the transaction
-                    "date": current_date.strftime(
-                        "%Y-%m-%d"
-                    ),  # Transaction date in YYYY-MM-DD format
-                    "order_id": random.randint(1000, 9999),  # Randomly generated order ID
-                    "client_id": random.randint(1, 50),  # Randomly generated client ID
-                    "prod_id": random.choice(range(1, 7)),  # Randomly select a product ID
-                    "prod_price": round(
-                        random.uniform(5, 500), 2
-                    ),  # Randomly generated product price
-                    "prod_qty": random.randint(1, 10),  # Randomly generated product quantity
-                }
-            )
-            transaction_id += 1  # Increment transaction ID for the next entry
-
-        # Move to the first day of the next month
-        next_month = current_date.month % 12 + 1
-        next_year = current_date.year if next_month != 1 else current_date.year + 1
-        current_date = datetime(next_year, next_month, 1)
-
-    # Convert to DataFrame
-    # Convert to DataFrame
     if store_data:
-        transactions_df = pd.DataFrame(transaction_data)
         transactions_df.to_csv("./data/transactions.csv", index=False)
         logger.info("Transactions data stored in ./data/transactions.csv")
 
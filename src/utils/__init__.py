@@ -1,10 +1,15 @@
 # Internal imports
 from src.utils.helpers import (
+    build_graph_indices,
     find_journal_with_most_drugs,
     find_journals_with_most_mentions_of_drug,
     load_graph_from_gml,
     load_graph_from_json,
+    load_graph_from_node_link,
+    load_graph_indices,
+    save_graph_indices,
     save_graph_to_json,
+    save_graph_to_node_link,
     visualize_graph,
 )
 
@@ -15,4 +20,9 @@ __all__ = [
     "visualize_graph",
     "find_journals_with_most_mentions_of_drug",
     "save_graph_to_json",
+    "build_graph_indices",
+    "load_graph_indices",
+    "save_graph_indices",
+    "load_graph_from_node_link",
+    "save_graph_to_node_link",
 ]
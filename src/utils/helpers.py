@@ -1,14 +1,21 @@
 # External imports
-import json
+import functools
+import hashlib
+import pickle
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Any, Dict, Set
+from typing import Any, Dict, Iterable, List, Set, Tuple, TypedDict, cast
 
 import networkx as nx
-import plotly.graph_objects as go
+import numpy as np
 from loguru import logger
 
 # Internal imports
-from src.models import Drug, Journal, Publication, PublicationType
+from src.models import PublicationType
+from src.utils.json_io import read_json, write_json
+
+CHARTS_DIR = Path(__file__).parent.parent.parent / "data" / "charts"
+LAYOUT_CACHE_DIR = CHARTS_DIR / ".layout_cache"
 
 
 def load_graph_from_gml(gml_path: Path) -> nx.DiGraph:
@@ -26,12 +33,14 @@ def load_graph_from_gml(gml_path: Path) -> nx.DiGraph:
         graph = nx.read_gml(gml_path)
 
         logger.info(
-            f"Graph loaded from GML with {len(graph.nodes)} nodes and {len(graph.edges)} edges"
+            "Graph loaded from GML with {} nodes and {} edges",
+            graph.number_of_nodes(),
+            graph.number_of_edges(),
         )
         return graph
 
     except Exception as e:
-        logger.error(f"Error loading graph from GML: {str(e)}")
+        logger.error("Error loading graph from GML: {}", e)
         raise
 
 
@@ -59,21 +68,29 @@ def load_graph_from_json(json_path: Path) -> nx.DiGraph:
             raise FileNotFoundError(f"Graph file not found: {json_path}")
 
         # Load JSON data
-        with open(json_path) as f:
-            graph_data = json.load(f)
+        graph_data = read_json(json_path)
 
         # Create new directed graph
         graph = nx.DiGraph()
 
+        # Nodes are indexed by the IDs relationships refer to as they are added, so edges
+        # are resolved with dict lookups and the graph is never scanned. The first node
+        # added for an ID wins.
+        drug_by_atccode: Dict[Any, str] = {}
+        publication_by_id: Dict[Tuple[Any, Any], str] = {}
+
         # Add drug nodes
         for drug in graph_data.get("drugs", []):
             # Use drug name as node ID
+            drug_node = drug.get("name").lower()
+            atccode = drug.get("atccode")
             graph.add_node(
-                drug.get("name").lower(),
+                drug_node,
                 type="drug",
-                atccode=drug.get("atccode"),  # Store atccode as attribute
+                atccode=atccode,  # Store atccode as attribute
                 # name=drug.get("name"),
             )
+            drug_by_atccode.setdefault(atccode, drug_node)
 
         # Add pubmed nodes
         for pubmed in graph_data.get("publications", {}).get("pubmed", []):
@@ -88,6 +105,7 @@ def load_graph_from_json(json_path: Path) -> nx.DiGraph:
                 date=pubmed.get("date"),
                 journal_name=pubmed.get("journal_name"),
             )
+            publication_by_id.setdefault(("pubmed", pubmed.get("id")), pub_id)
 
         # Add clinical trial nodes
         for trial in graph_data.get("publications", {}).get("clinical_trials", []):
@@ -102,6 +120,7 @@ def load_graph_from_json(json_path: Path) -> nx.DiGraph:
                 date=trial.get("date"),
                 journal_name=trial.get("journal_name"),
             )
+            publication_by_id.setdefault(("clinical_trial", trial.get("id")), pub_id)
 
         # Add journal nodes
         for journal in graph_data.get("journals", []):
@@ -126,21 +145,13 @@ def load_graph_from_json(json_path: Path) -> nx.DiGraph:
             # Map IDs to node IDs in the graph
             if source_type == "drug":
                 # Find drug node by atccode
-                source_node = None
-                for node, attrs in graph.nodes(data=True):
-                    if attrs.get("type") == "drug" and attrs.get("atccode") == source_id:
-                        source_node = node
-                        break
+                source_node = drug_by_atccode.get(source_id)
             else:
                 source_node = source_id[:20].lower() if source_id else None
 
             if target_type in ["pubmed", "clinical_trial"]:
                 # Find publication node by ID
-                target_node = None
-                for node, attrs in graph.nodes(data=True):
-                    if attrs.get("type") == target_type and attrs.get("id") == target_id:
-                        target_node = node
-                        break
+                target_node = publication_by_id.get((target_type, target_id))
             elif target_type == "journal":
                 # Use truncated journal name
                 target_node = target_id[:20] if target_id else None
@@ -162,15 +173,198 @@ def load_graph_from_json(json_path: Path) -> nx.DiGraph:
                 )
 
         logger.info(
-            f"Graph loaded from JSON with {len(graph.nodes)} nodes and {len(graph.edges)} edges"
+            "Graph loaded from JSON with {} nodes and {} edges",
+            graph.number_of_nodes(),
+            graph.number_of_edges(),
+        )
+        return graph
+
+    except Exception as e:
+        logger.error("Error loading graph from JSON: {}", e)
+        raise
+
+
+class GraphIndices(TypedDict):
+    """Inverted indices of the drug -> journal relationships of a drug mentions graph."""
+
+    drug_to_journal_counts: Dict[str, Counter[str]]  # drug node -> journal name -> mentions
+    journal_to_drug_set: Dict[str, Set[str]]  # journal name -> ATC codes of its drugs
+
+
+def load_graph_from_node_link(json_path: Path) -> nx.DiGraph:
+    """
+    Load a NetworkX graph from a node-link JSON file.
+
+    Nodes and edges are stored under their graph IDs, so the graph is rebuilt directly,
+    without the ID resolution load_graph_from_json needs for the exported schema.
+
+    Args:
+        json_path (Path): Path to the node-link JSON file.
+
+    Returns:
+        nx.DiGraph: Loaded graph
+    """
+    try:
+        graph = nx.node_link_graph(read_json(json_path), directed=True)
+
+        logger.info(
+            "Graph loaded from node-link JSON with {} nodes and {} edges",
+            graph.number_of_nodes(),
+            graph.number_of_edges(),
         )
         return graph
 
     except Exception as e:
-        logger.error(f"Error loading graph from JSON: {str(e)}")
+        logger.error("Error loading graph from node-link JSON: {}", e)
         raise
 
 
+def _indices_path(graph_path: Path) -> Path:
+    """Return the path of the pickled indices stored next to a graph file."""
+    return graph_path.with_suffix(".indices.pkl")
+
+
+def build_graph_indices(graph: nx.DiGraph) -> GraphIndices:
+    """
+    Build the drug -> journal and journal -> drug indices of a drug mentions graph.
+
+    The graph is walked once so that the ad-hoc analyses become dictionary lookups.
+
+    Args:
+        graph (nx.DiGraph): The drug mentions graph.
+
+    Returns:
+        GraphIndices: The drug -> journal counts and journal -> drugs indices.
+    """
+    drug_to_journal_counts: Dict[str, Counter[str]] = {}
+    journal_to_drug_set: defaultdict[str, Set[str]] = defaultdict(set)
+
+    nodes = graph.nodes
+    succ = graph.succ
+
+    # Every drug gets an entry, even when it is not mentioned in any journal
+    drug_nodes = [node for node, attrs in nodes(data=True) if attrs.get("type") == "drug"]
+    for node in drug_nodes:
+        drug_to_journal_counts[node] = Counter()
+
+    # Drug-journal relationships start from drug nodes: only their out-edges are walked,
+    # straight from the adjacency view, and each node's attribute dict is fetched once
+    for source in drug_nodes:
+        drug_atccode = nodes[source].get("atccode")
+        journal_counts = drug_to_journal_counts[source]
+
+        for target in succ[source]:
+            target_attrs = nodes[target]
+            if target_attrs.get("type") == "journal":
+                # Get the full journal name from the node attributes
+                journal_name = target_attrs.get("name")
+                journal_counts[journal_name] += 1
+                journal_to_drug_set[journal_name].add(drug_atccode)
+
+    # Handed out as a plain dict, so that a lookup of an unknown journal does not add it
+    return {
+        "drug_to_journal_counts": drug_to_journal_counts,
+        "journal_to_drug_set": dict(journal_to_drug_set),
+    }
+
+
+def save_graph_indices(graph: nx.DiGraph, graph_path: Path) -> Path:
+    """
+    Pickle the indices of a graph next to its saved JSON file.
+
+    The indices must be saved after the graph file: they are only used while they
+    are at least as recent as the graph.
+
+    Args:
+        graph (nx.DiGraph): The drug mentions graph.
+        graph_path (Path): Path of the saved graph JSON file.
+
+    Returns:
+        Path: Path to the pickled indices.
+    """
+    indices_path = _indices_path(graph_path)
+    indices_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(indices_path, "wb") as f:
+        pickle.dump(build_graph_indices(graph), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    logger.info("Graph indices saved to: {}", indices_path)
+    return indices_path
+
+
+def _mtime_ns(path: Path) -> int:
+    """Return the modification time of a file in nanoseconds, or -1 if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return -1
+
+
+@functools.lru_cache(maxsize=8)
+def _load_graph_indices_cached(
+    graph_path: Path, graph_mtime_ns: int, indices_mtime_ns: int
+) -> GraphIndices:
+    """
+    Load the indices of a graph, memoized on the modification times of its files.
+
+    Args:
+        graph_path (Path): Resolved path to the drug mentions graph JSON file.
+        graph_mtime_ns (int): Modification time of the graph file, -1 if missing.
+        indices_mtime_ns (int): Modification time of the pickled indices, -1 if missing.
+
+    Returns:
+        GraphIndices: The drug -> journal counts and journal -> drugs indices.
+    """
+    if graph_mtime_ns >= 0 and indices_mtime_ns >= graph_mtime_ns:
+        with open(_indices_path(graph_path), "rb") as f:
+            return cast(GraphIndices, pickle.load(f))
+
+    return build_graph_indices(load_graph_from_json(graph_path))
+
+
+def load_graph_indices(graph_path: Path) -> GraphIndices:
+    """
+    Load the indices of a graph, preferring the pickle saved by the pipeline.
+
+    The pickle is only used when it is at least as recent as the graph file,
+    otherwise the graph is loaded and walked. Indices are kept in memory for as long
+    as neither file changes, so repeated analyses of a graph load it only once; they
+    are shared between callers and must not be modified.
+
+    Args:
+        graph_path (Path): Path to the drug mentions graph JSON file.
+
+    Returns:
+        GraphIndices: The drug -> journal counts and journal -> drugs indices.
+    """
+    graph_path = graph_path.resolve()
+    return _load_graph_indices_cached(
+        graph_path, _mtime_ns(graph_path), _mtime_ns(_indices_path(graph_path))
+    )
+
+
+def _top_ties(counts: Iterable[Tuple[str, int]]) -> Tuple[List[str], int]:
+    """
+    Find the keys with the highest count, in a single pass over the (key, count) pairs.
+
+    Args:
+        counts (Iterable[Tuple[str, int]]): The (key, count) pairs.
+
+    Returns:
+        Tuple[List[str], int]: The alphabetically sorted keys with the highest count,
+            and that count.
+    """
+    best: List[str] = []
+    best_count = -1
+    for key, count in counts:
+        if count > best_count:
+            best_count = count
+            best = [key]
+        elif count == best_count:
+            best.append(key)
+    best.sort()
+    return best, best_count
+
+
 def find_journal_with_most_drugs(graph_path: Path) -> tuple[list[str], int]:
     """
     Find the journal(s) that mention the highest number of different drugs.
@@ -191,49 +385,22 @@ def find_journal_with_most_drugs(graph_path: Path) -> tuple[list[str], int]:
         Exception: For errors during graph analysis.
     """
     try:
-        # Load the graph
-        graph = load_graph_from_json(graph_path)
-
-        # Create a dictionary to count drugs per journal
-        journal_drug_counts: Dict[str, Set[str]] = {}
-
-        # Iterate through all edges
-        for source, target, _ in graph.edges(data=True):
-            source_type = graph.nodes[source].get("type")
-            target_type = graph.nodes[target].get("type")
-
-            # Check if this is a drug-journal relationship
-            if source_type == "drug" and target_type == "journal":
-                # Get the full journal name from the node attributes
-                journal_name = graph.nodes[target].get("name")
-                drug_atccode = graph.nodes[source].get("atccode")
-
-                if journal_name not in journal_drug_counts:
-                    journal_drug_counts[journal_name] = set()
-
-                journal_drug_counts[journal_name].add(drug_atccode)
+        # Load the journal -> drugs index
+        journal_drug_counts = load_graph_indices(graph_path)["journal_to_drug_set"]
 
         # Find journal with most drugs
         if not journal_drug_counts:
             return (["No journals found"], 0)
 
-        # Find the maximum number of drugs
-        max_drug_count = max(len(drugs) for drugs in journal_drug_counts.values())
-
-        # Get all journals with the maximum number of drugs
-        top_journals = [
-            journal
-            for journal, drugs in journal_drug_counts.items()
-            if len(drugs) == max_drug_count
-        ]
-
-        # Sort alphabetically
-        top_journals.sort()
+        # Find the journals with the maximum number of drugs, sorted alphabetically
+        top_journals, max_drug_count = _top_ties(
+            (journal, len(drugs)) for journal, drugs in journal_drug_counts.items()
+        )
 
         return (top_journals, max_drug_count)
 
     except Exception as e:
-        logger.error(f"Error finding journal with most drugs: {str(e)}")
+        logger.error("Error finding journal with most drugs: {}", e)
         # Return a default value in case of error
         return (["Error processing journals"], 0)
 
@@ -261,57 +428,58 @@ def find_journals_with_most_mentions_of_drug(
         Exception: For errors during graph analysis.
     """
     try:
-        # Load the graph
-        graph = load_graph_from_json(graph_path)
-
-        # Dictionary to count mentions of the specific drug per journal
-        journal_mentions = {}
+        # Load the drug -> journals index
+        drug_to_journal_counts = load_graph_indices(graph_path)["drug_to_journal_counts"]
 
-        # Find the drug node(s) with the specified name
-        drug_nodes = []
-        for node, attrs in graph.nodes(data=True):
-            if attrs.get("type") == "drug" and node == drug_name:
-                drug_nodes.append(node)
+        # Mentions of the specific drug per journal, found with a single lookup
+        journal_mentions = drug_to_journal_counts.get(drug_name)
+        if journal_mentions is None:
+            logger.warning("No drug found with name: {}", drug_name)
+            return (["No journals found"], 0)
 
-        if not drug_nodes:
-            logger.warning(f"No drug found with name: {drug_name}")
+        # If no journals mention this drug
+        if not journal_mentions:
             return (["No journals found"], 0)
 
-        # For each drug node, count mentions in journals
-        for drug_node in drug_nodes:
-            # Get all edges from this drug node
-            for _, target in graph.out_edges(drug_node):
-                target_type = graph.nodes[target].get("type")
+        # Find the journals with the maximum number of mentions, sorted alphabetically
+        top_journals, max_mentions = _top_ties(journal_mentions.items())
 
-                # Check if the target is a journal
-                if target_type == "journal":
-                    journal_name = graph.nodes[target].get("name")
+        return (top_journals, max_mentions)
 
-                    if journal_name not in journal_mentions:
-                        journal_mentions[journal_name] = 1
+    except Exception as e:
+        logger.error("Error finding journals with most mentions of drug {}: {}", drug_name, e)
+        return (["Error processing journals"], 0)
 
-                    journal_mentions[journal_name] += 1
 
-        # If no journals mention this drug
-        if not journal_mentions:
-            return (["No journals found"], 0)
+def _graph_layout(graph: nx.DiGraph, cache_dir: Path = LAYOUT_CACHE_DIR) -> Dict[Any, np.ndarray]:
+    """
+    Compute the spring layout of a graph, reusing the one cached on disk for the same graph.
 
-        # Find the maximum number of mentions
-        max_mentions = max(journal_mentions.values())
+    The cache key is a hash of the sorted nodes and edges, and the coordinates are stored
+    in that sorted node order, so the insertion order of the graph does not matter.
 
-        # Get all journals with the maximum number of mentions
-        top_journals = [
-            journal for journal, mentions in journal_mentions.items() if mentions == max_mentions
-        ]
+    Args:
+        graph (nx.DiGraph): The graph to lay out.
+        cache_dir (Path): Directory holding the cached layouts.
 
-        # Sort alphabetically
-        top_journals.sort()
+    Returns:
+        Dict[Any, np.ndarray]: The position of each node.
+    """
+    nodes = sorted(graph.nodes, key=str)
+    edges = sorted(f"{u}->{v}" for u, v in graph.edges)
+    raw = ",".join(map(str, nodes)) + "|" + ",".join(edges)
+    cache_path = cache_dir / f"{hashlib.blake2b(raw.encode()).hexdigest()[:16]}.npz"
 
-        return (top_journals, max_mentions)
+    if cache_path.exists():
+        with np.load(cache_path) as cached:
+            logger.info("Graph layout loaded from cache: {}", cache_path)
+            return dict(zip(nodes, cached["coords"]))
 
-    except Exception as e:
-        logger.error(f"Error finding journals with most mentions of drug {drug_name}: {str(e)}")
-        return (["Error processing journals"], 0)
+    pos = cast(Dict[Any, np.ndarray], nx.spring_layout(graph, seed=42))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    coords = np.stack([pos[node] for node in nodes]) if nodes else np.empty((0, 2))
+    np.savez(cache_path, coords=coords)
+    return pos
 
 
 def visualize_graph(graph: nx.DiGraph, store: bool = False) -> None:
@@ -325,6 +493,8 @@ def visualize_graph(graph: nx.DiGraph, store: bool = False) -> None:
     Args:
         graph (networkx.Graph): The dependency graph to visualize.
     """
+    # Plotly is slow to import and only needed here, so loading the graph helpers stays cheap
+    import plotly.graph_objects as go
 
     # Build new labels by removing the root folder from node names
     new_labels = {}
@@ -346,31 +516,36 @@ def visualize_graph(graph: nx.DiGraph, store: bool = False) -> None:
         node_type = graph.nodes[node].get("type", "unknown")
         node_colors.append(color_map.get(node_type, "gray"))
 
-    # Generate node positions using force-directed layout
-    pos = nx.spring_layout(graph, seed=42)
-
-    # Create edge traces
-    edge_traces = []
-    for edge in graph.edges:
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_trace = go.Scatter(
-            x=[x0, x1, None],
-            y=[y0, y1, None],
-            line={"width": 1, "color": "gray"},
-            mode="lines",
-            hoverinfo="none",
-        )
-        edge_traces.append(edge_trace)
+    # Generate node positions using force-directed layout, cached across calls
+    pos = _graph_layout(graph)
+
+    # Stack the positions into one (n, 2) array, rows in graph.nodes order
+    nodes_list = list(graph.nodes)
+    node_index = {node: i for i, node in enumerate(nodes_list)}
+    coords = np.fromiter(
+        (c for node in nodes_list for c in pos[node]),
+        dtype=np.float64,
+        count=2 * len(nodes_list),
+    ).reshape(-1, 2)
+
+    # Create a single edge trace, segments separated by NaN so Plotly breaks the line
+    sources = np.fromiter((node_index[u] for u, _ in graph.edges), dtype=np.intp)
+    targets = np.fromiter((node_index[v] for _, v in graph.edges), dtype=np.intp)
+    gaps = np.full(len(sources), np.nan)
+    edge_x = np.column_stack([coords[sources, 0], coords[targets, 0], gaps]).ravel()
+    edge_y = np.column_stack([coords[sources, 1], coords[targets, 1], gaps]).ravel()
+    edge_trace = go.Scatter(
+        x=edge_x,
+        y=edge_y,
+        line={"width": 1, "color": "gray"},
+        mode="lines",
+        hoverinfo="none",
+    )
 
     # Create node trace
-    node_x, node_y, node_text, node_hover = [], [], [], []
-    for node in graph.nodes:
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
-        node_text.append(new_labels[node])
-        node_hover.append(f"Type: {graph.nodes[node].get('type', 'unknown')}")
+    node_x, node_y = coords[:, 0], coords[:, 1]
+    node_text = [new_labels[node] for node in nodes_list]
+    node_hover = [f"Type: {graph.nodes[node].get('type', 'unknown')}" for node in nodes_list]
 
     node_trace = go.Scatter(
         x=node_x,
@@ -389,7 +564,7 @@ def visualize_graph(graph: nx.DiGraph, store: bool = False) -> None:
     )
 
     # Create interactive figure
-    fig = go.Figure(data=edge_traces + [node_trace])
+    fig = go.Figure(data=[edge_trace, node_trace])
     fig.update_layout(
         title="Drug Mentions Graph",
         showlegend=False,
@@ -401,10 +576,9 @@ def visualize_graph(graph: nx.DiGraph, store: bool = False) -> None:
 
     fig.show()
     if store:
-        path_ = Path(__file__).parent.parent.parent / "data" / "charts"
         # Save the figure as an HTML file
-        fig.write_html(path_ / "graph.html")
-        fig.write_image(path_ / "graph.png")
+        fig.write_html(CHARTS_DIR / "graph.html")
+        fig.write_image(CHARTS_DIR / "graph.png")
 
     return
 
@@ -427,59 +601,51 @@ def save_graph_to_json(graph: nx.DiGraph, output_path: Path) -> None:
     journals: list[Dict[str, str]] = []  # List to store journal nodes
     relationships: list[Dict[str, str]] = []  # List to store relationships (edges)
 
+    # Reference ({"id", "type"}) of each node in the relationships, built in the nodes pass
+    # so the edges pass does a single lookup per endpoint. Drugs are referenced by ATC code,
+    # publications by id and journals by name.
+    node_refs: Dict[Any, Dict[str, Any]] = {}
+
     # Process nodes
     for node, attrs in graph.nodes(data=True):
         node_type = attrs.get("type")  # Determine the type of node
 
+        # Records are built straight from the node attributes, which were produced from
+        # already-cleaned models, so going through Drug/Publication/Journal and asdict
+        # would only add an object and a deep copy per node. Keys follow the model fields.
         if node_type == "drug":
-            # Create a Drug object and append its dictionary representation
-            drug = Drug(atccode=attrs.get("atccode", ""), name=node)
-            drugs.append(drug.model_dump())
+            drugs.append({"atccode": attrs.get("atccode", ""), "name": node})
+            node_refs[node] = {"id": attrs.get("atccode"), "type": node_type}
 
         elif node_type in ["pubmed", "clinical_trial"]:
-            # Create a Publication object and append its dictionary representation
-            publication = Publication(
-                id=attrs.get("id"),
-                title=attrs.get("title"),
-                date=attrs.get("date"),
-                journal_name=attrs.get("journal_name"),
-                source_type=PublicationType.PUBMED
+            publication = {
+                "id": attrs.get("id"),
+                "title": attrs.get("title"),
+                "date": attrs.get("date"),
+                "journal_name": attrs.get("journal_name"),
+                "source_type": PublicationType.PUBMED
                 if node_type == "pubmed"
                 else PublicationType.CLINICAL_TRIAL,
-            )
+            }
             if node_type == "pubmed":
-                pubmeds.append(publication.model_dump())
+                pubmeds.append(publication)
             else:
-                clinical_trials.append(publication.model_dump())
+                clinical_trials.append(publication)
+            node_refs[node] = {"id": attrs.get("id"), "type": node_type}
 
         elif node_type == "journal":
-            # Create a Journal object and append its dictionary representation
-            journal = Journal(name=attrs.get("name"))
-            journals.append(journal.model_dump())
-
-    # Process edges (relationships)
-    for source, target, attrs in graph.edges(data=True):
-        # Get node types to determine relationship type
-        source_type = graph.nodes[source].get("type")
-        target_type = graph.nodes[target].get("type")
+            journals.append({"name": attrs.get("name")})
+            node_refs[node] = {"id": attrs.get("name"), "type": node_type}
 
-        # Get proper IDs for JSON representation
-        if source_type == "drug":
-            source_id = graph.nodes[source].get("atccode")
         else:
-            source_id = source
+            node_refs[node] = {"id": node, "type": node_type}
 
-        if target_type in ["pubmed", "clinical_trial"]:
-            target_id = graph.nodes[target].get("id")
-        elif target_type == "journal":
-            target_id = graph.nodes[target].get("name")
-        else:
-            target_id = target
-
-        # Create a relationship dictionary and append it
+    # Process edges (relationships)
+    # The references are shared between relationships, they are only read by the writer
+    for source, target, attrs in graph.edges(data=True):
         relationship = {
-            "source": {"id": source_id, "type": source_type},
-            "target": {"id": target_id, "type": target_type},
+            "source": node_refs[source],
+            "target": node_refs[target],
             "type": attrs.get("relationship"),
             "date_mention": attrs.get("date_mention"),
         }
@@ -494,7 +660,23 @@ def save_graph_to_json(graph: nx.DiGraph, output_path: Path) -> None:
     }
 
     # Save to JSON
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(graph_data, f, indent=2)
+    write_json(graph_data, output_path)
+
+    logger.info("Graph saved to JSON: {}", output_path)
+
+
+def save_graph_to_node_link(graph: nx.DiGraph, output_path: Path) -> None:
+    """
+    Save a NetworkX graph to a compact node-link JSON file.
+
+    This is the internal counterpart of save_graph_to_json: the graph is dumped as is,
+    node IDs included, so load_graph_from_node_link can rebuild it in a single pass.
+
+    Args:
+        graph (nx.DiGraph): The NetworkX directed graph to save.
+        output_path (Path): The file path where the JSON will be saved.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(nx.node_link_data(graph), output_path, indent=False)
 
-    logger.info(f"Graph saved to JSON: {output_path}")
+    logger.info("Graph saved to node-link JSON: {}", output_path)
@@ -0,0 +1,66 @@
+# External imports
+import json
+import mmap
+from pathlib import Path
+from typing import Any, Union
+
+# orjson is an optional, faster drop-in for the json module
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def loads_json(content: Union[bytes, mmap.mmap]) -> Any:
+    """
+    Parse JSON bytes or a memory-mapped file, using orjson when it is installed.
+
+    Both parsers raise json.JSONDecodeError (orjson's error subclasses it) on invalid input.
+
+    Args:
+        content (Union[bytes, mmap.mmap]): Raw JSON document.
+
+    Returns:
+        Any: The parsed document.
+    """
+    if isinstance(content, mmap.mmap):
+        if HAS_ORJSON:
+            # orjson reads the mapping through a buffer view, without copying it
+            with memoryview(content) as view:
+                return orjson.loads(view)
+        content = content[:]  # The json module only parses bytes or str
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def read_json(json_path: Path) -> Any:
+    """
+    Parse a JSON file, using orjson when it is installed.
+
+    Args:
+        json_path (Path): Path to the JSON file.
+
+    Returns:
+        Any: The parsed JSON document.
+    """
+    return loads_json(json_path.read_bytes())
+
+
+def write_json(data: Any, output_path: Path, indent: bool = True) -> None:
+    """
+    Write data as JSON, using orjson when it is installed.
+
+    Args:
+        data (Any): JSON-serializable data.
+        output_path (Path): The file path where the JSON will be saved.
+        indent (bool): Indent with 2 spaces, otherwise write compact JSON.
+    """
+    if HAS_ORJSON:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None))
+        return
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2 if indent else None)
@@ -26,8 +26,9 @@ Usage:
 """
 
 # External imports
+import os
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Generator, Optional
 
 import typer
 from loguru import logger
@@ -48,14 +49,28 @@ class DisplayablePath(object):
     display_parent_prefix_middle = "    "
     display_parent_prefix_last = "│   "
 
-    def __init__(self, path: Path, parent_path: Any, is_last: bool) -> None:
+    def __init__(
+        self, path: Path, parent_path: Any, is_last: bool, is_dir: Optional[bool] = None
+    ) -> None:
         self.path = Path(str(path))
         self.parent = parent_path
         self.is_last = is_last
+        # Looked up once, unless the caller already knows it (e.g. from os.scandir)
+        self._is_dir = self.path.is_dir() if is_dir is None else is_dir
         if self.parent:
             self.depth = self.parent.depth + 1
         else:
             self.depth = 0
+        # Tree prefix drawn by the ancestors (the root excluded), built from the parent's
+        # so displayable() does not walk up the tree for every path
+        if self.parent is None or self.parent.parent is None:
+            self._parent_prefix = ""
+        else:
+            self._parent_prefix = self.parent._parent_prefix + (
+                self.display_parent_prefix_middle
+                if self.parent.is_last
+                else self.display_parent_prefix_last
+            )
 
     @classmethod
     def make_tree(
@@ -76,22 +91,28 @@ class DisplayablePath(object):
         root = Path(str(root))
         criteria = criteria or cls._default_criteria
 
-        displayable_root = cls(root, parent, is_last)
+        displayable_root = cls(root, parent, is_last, is_dir=True)
         yield displayable_root
 
-        children = sorted(
-            [path for path in root.iterdir() if criteria(path)],
-            key=lambda s: str(s).lower(),
-        )
+        # os.scandir reports whether each entry is a directory without an extra stat call
+        with os.scandir(root) as entries:
+            children = sorted(
+                [
+                    (path, entry.is_dir())
+                    for entry in entries
+                    if criteria(path := Path(entry.path))
+                ],
+                key=lambda s: str(s[0]).lower(),
+            )
         count = 1
-        for path in children:
+        for path, is_dir in children:
             is_last = count == len(children)
-            if path.is_dir():
+            if is_dir:
                 yield from cls.make_tree(
                     path, parent=displayable_root, is_last=is_last, criteria=criteria
                 )
             else:
-                yield cls(path, displayable_root, is_last)
+                yield cls(path, displayable_root, is_last, is_dir=False)
             count += 1
 
     @classmethod
@@ -115,7 +136,7 @@ class DisplayablePath(object):
         Returns:
             str: The display name, with a trailing slash for directories.
         """
-        if self.path.is_dir():
+        if self._is_dir:
             return self.path.name + "/"
         return self.path.name
 
@@ -135,18 +156,7 @@ class DisplayablePath(object):
             else self.display_filename_prefix_middle
         )
 
-        parts = ["{!s} {!s}".format(_filename_prefix, self.displayname)]
-
-        parent = self.parent
-        while parent and parent.parent is not None:
-            parts.append(
-                self.display_parent_prefix_middle
-                if parent.is_last
-                else self.display_parent_prefix_last
-            )
-            parent = parent.parent
-
-        return "".join(reversed(parts))
+        return f"{self._parent_prefix}{_filename_prefix} {self.displayname}"
 
 
 def is_not_hidden(this_path: Path) -> bool:
@@ -272,7 +282,7 @@ def main(
             file.write(fullpath)
         logger.info("Printed Tree Structure in ./project_structure.txt...")
 
-    logger.success(f"Processing project structure complete:\n{fullpath}")
+    logger.success("Processing project structure complete:\n{}", fullpath)
     return fullpath
 
 
@@ -0,0 +1,129 @@
+"""
+This module contains tests for the Parquet cache of the extraction tasks.
+
+The tests decorate a small extraction function with a cache in a temporary
+directory and count its calls to tell cache hits from misses.
+
+Classes:
+    TestParquetCache: A unittest.TestCase subclass that tests the cache hits,
+    the invalidation on source changes and the round trip of the models.
+
+Usage:
+    Run this module with unittest to execute the cache tests.
+    Example:
+        python -m unittest tests/cache_test.py
+"""
+
+
+# External imports
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Internal imports
+from src.models.schemas import Publication, PublicationType
+from src.pipeline import cache
+from src.pipeline.cache import HAS_PYARROW, parquet_cache
+
+PUBLICATIONS = [
+    Publication(
+        id="01",
+        title="First title",
+        date="2020-01-01",
+        journal_name="Journal A",
+        source_type=PublicationType.PUBMED,
+    ),
+    Publication(
+        id="NCT1",
+        title="First trial",
+        date="NaT",
+        journal_name="Journal B",
+        source_type=PublicationType.CLINICAL_TRIAL,
+    ),
+]
+
+
+# python -m unittest tests/cache_test.py
+@unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+class TestParquetCache(unittest.TestCase):
+    """
+    Test the Parquet cache on an extraction function counting its calls.
+    """
+
+    def setUp(self):
+        """
+        Create a source file, a cache directory and a cached extraction function.
+        """
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        tmp_path = Path(self._tmp_dir.name)
+        self.source = tmp_path / "source.csv"
+        self.source.write_text("id\n01\n")
+        self.calls = 0
+
+        def extract(path):
+            self.calls += 1
+            return list(PUBLICATIONS)
+
+        self.extract = parquet_cache(Publication, cache_dir=tmp_path / "cache")(extract)
+
+    def tearDown(self):
+        """
+        Remove the temporary directory and its files.
+        """
+        self._tmp_dir.cleanup()
+
+    def test_cache_hit(self):
+        """
+        Test that a second call with an unchanged source is served from the cache.
+        """
+        self.extract(self.source)
+        self.extract(self.source)
+
+        self.assertEqual(self.calls, 1)
+
+    def test_cache_leaves_no_temporary_file(self):
+        """
+        Test that a miss leaves only the Parquet file in the cache directory.
+        """
+        self.extract(self.source)
+
+        cache_files = list((self.source.parent / "cache").iterdir())
+        self.assertEqual([path.suffix for path in cache_files], [".parquet"])
+
+    def test_cache_miss_on_mtime_change(self):
+        """
+        Test that modifying the source file invalidates the cache entry.
+        """
+        self.extract(self.source)
+        stat = self.source.stat()
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.extract(self.source)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_cache_miss_on_version_change(self):
+        """
+        Test that bumping the cache version invalidates the cache entry.
+        """
+        self.extract(self.source)
+        with mock.patch.object(cache, "CACHE_VERSION", cache.CACHE_VERSION + 1):
+            self.extract(self.source)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_cache_round_trip(self):
+        """
+        Test that the cached models, Enum fields included, equal the extracted ones.
+        """
+        self.extract(self.source)
+        cached = self.extract(self.source)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(cached, PUBLICATIONS)
+        self.assertTrue(all(isinstance(pub.source_type, PublicationType) for pub in cached))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+This module contains tests for the data extractors of the pharmaceutical data pipeline.
+
+The tests write small input files to a temporary directory and check the
+publications extracted from them, covering the edge cases of the cleaning
+steps (missing dates, CSV encodings, ...).
+
+Classes:
+    TestExtractors: A unittest.TestCase subclass that tests the publication
+    and clinical trial extractors.
+
+Usage:
+    Run this module with unittest to execute the extractor tests.
+    Example:
+        python -m unittest tests/extractors_test.py
+"""
+
+
+# External imports
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Internal imports
+from src.pipeline.extractors import (
+    HAS_IJSON,
+    ClinicalTrialExtractor,
+    DrugExtractor,
+    PublicationExtractor,
+)
+
+
+# python -m unittest tests/extractors_test.py
+class TestExtractors(unittest.TestCase):
+    """
+    Test the extractors on small input files written to a temporary directory.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary directory for the input files of a test.
+        """
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp_dir.name)
+
+    def tearDown(self):
+        """
+        Remove the temporary directory and its files.
+        """
+        self._tmp_dir.cleanup()
+
+    def write_file(self, name, content, encoding="utf-8"):
+        """
+        Write an input file in the temporary directory and return its path.
+        """
+        path = self.tmp_path / name
+        path.write_text(content, encoding=encoding)
+        return path
+
+    def test_drug_missing_name(self):
+        """
+        Test that a drug without a name is rejected instead of being extracted.
+        """
+        path = self.write_file("drugs.csv", "atccode,drug\nA01,\nA02,  Foo\n")
+
+        with self.assertRaises(ValueError):
+            DrugExtractor(path).extract()
+
+    def test_publication_missing_date(self):
+        """
+        Test that a publication without a date is kept, with "NaT" as its date.
+        """
+        path = self.write_file(
+            "pubmed.csv",
+            "id,title,date,journal\n1,First title,01/01/2020,Journal A\n2,Second title,,Journal B\n",
+        )
+
+        publications = PublicationExtractor(path).extract("csv")
+
+        self.assertEqual([pub.date for pub in publications], ["2020-01-01", "NaT"])
+
+    def test_publication_empty_date_json(self):
+        """
+        Test that an empty date string in JSON is handled as a missing date.
+        """
+        path = self.write_file(
+            "pubmed.json",
+            '[{"id": 1, "title": "First title", "date": "", "journal": "Journal A"}]',
+        )
+
+        publications = PublicationExtractor(path).extract("json")
+
+        self.assertEqual([pub.date for pub in publications], ["NaT"])
+
+    def test_publication_json_trailing_comma(self):
+        """
+        Test that a JSON file with a trailing comma is fixed without being streamed first.
+        """
+        path = self.write_file(
+            "pubmed.json",
+            '[{"id": 1, "title": "First title", "date": "01/01/2020", "journal": "Journal A"},]',
+        )
+
+        with mock.patch.object(PublicationExtractor, "_stream_json_chunks") as stream:
+            publications = PublicationExtractor(path).extract("json")
+
+        stream.assert_not_called()
+        self.assertEqual([pub.id for pub in publications], ["1"])
+
+    @unittest.skipUnless(HAS_IJSON, "ijson is not installed")
+    def test_publication_json_comma_in_title(self):
+        """
+        Test that a JSON file with ",]" inside a title is still streamed, not read whole.
+        """
+        path = self.write_file(
+            "pubmed.json",
+            '[{"id": 1, "title": "A list [a, b,]", "date": "01/01/2020", "journal": "J"}]',
+        )
+
+        with mock.patch.object(PublicationExtractor, "_read_json_safely") as read_whole:
+            publications = PublicationExtractor(path).extract("json")
+
+        read_whole.assert_not_called()
+        self.assertEqual([pub.title for pub in publications], ["A list [a, b,]"])
+
+    def test_publication_csv_with_bom(self):
+        """
+        Test that ids keep their leading zeros in a CSV file starting with a byte order mark.
+        """
+        path = self.write_file(
+            "pubmed.csv",
+            "id,title,date,journal\n01,First title,01/01/2020,Journal A\n",
+            encoding="utf-8-sig",
+        )
+
+        publications = PublicationExtractor(path).extract("csv")
+
+        self.assertEqual([pub.id for pub in publications], ["01"])
+
+    def test_publication_jsonl_parallel(self):
+        """
+        Test that reading JSON Lines in worker processes gives the same publications as in process.
+        """
+        lines = [
+            f'{{"id": {i}, "title": "Title {i}", "date": "01/01/2020", "journal": "Journal"}}'
+            for i in range(1, 21)
+        ]
+        # Duplicates spread over several byte ranges are dropped as in a sequential read
+        lines += ['{"id": 3, "title": "Again", "date": "2020-01-01", "journal": "Journal"}', ""]
+        path = self.write_file("pubmed.jsonl", "\n".join(lines) + "\n")
+
+        sequential = PublicationExtractor(path).extract("jsonl")
+        # A threshold of 0 sends the file to the process pool, split into ranges of ~256 bytes
+        parallel = PublicationExtractor(
+            path, parallel_min_jsonl_bytes=0, jsonl_task_bytes=256
+        ).extract("jsonl")
+
+        self.assertEqual(len(sequential), 20)
+        self.assertEqual(parallel, sequential)
+
+    def test_clinical_trial_missing_date(self):
+        """
+        Test that a clinical trial without a date is kept, with "NaT" as its date.
+        """
+        path = self.write_file(
+            "clinical_trials.csv",
+            "id,scientific_title,date,journal\n"
+            "NCT1,First trial,1 January 2020,Journal A\n"
+            "NCT2,Second trial,,Journal B\n",
+        )
+
+        clinical_trials = ClinicalTrialExtractor(path).extract()
+
+        self.assertEqual([trial.date for trial in clinical_trials], ["2020-01-01", "NaT"])
+
+
+if __name__ == "__main__":
+    unittest.main()
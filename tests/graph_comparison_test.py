@@ -20,11 +20,20 @@ Usage:
 
 
 # External imports
+import tempfile
 import unittest
 from pathlib import Path
 
+import networkx as nx
+
 # Internal imports
-from src.utils import load_graph_from_gml, load_graph_from_json
+from main import save_graph_gml, save_graph_json, save_graph_node_link
+from src.pipeline.extractors import ClinicalTrialExtractor, DrugExtractor, PublicationExtractor
+from src.pipeline.transformers import DrugMentionGraphTransformer
+from src.utils import load_graph_from_gml, load_graph_from_json, load_graph_from_node_link
+
+# Input files of the pipeline, resolved once at import
+INPUT_DIR = Path(__file__).resolve().parents[1] / "data" / "input"
 
 
 def compare_graphs(graph1, graph2):
@@ -44,21 +53,23 @@ def compare_graphs(graph1, graph2):
             - missing_edges: Set of edges in graph1 but not in graph2
             - extra_edges: Set of edges in graph2 but not in graph1
     """
-    # Get nodes and edges from both graphs
-    nodes1 = set(graph1.nodes())
-    nodes2 = set(graph2.nodes())
+    # Get nodes and edges from both graphs (iterating a graph yields its nodes directly)
+    nodes1 = set(graph1)
+    nodes2 = set(graph2)
     edges1 = set(graph1.edges())
     edges2 = set(graph2.edges())
 
-    # Compare nodes
-    same_nodes = nodes1 == nodes2
-    missing_nodes = nodes1 - nodes2
-    extra_nodes = nodes2 - nodes1
+    # Compare nodes: one symmetric difference, then split by the graph each node is in
+    node_diff = nodes1 ^ nodes2
+    same_nodes = not node_diff
+    missing_nodes = node_diff & nodes1
+    extra_nodes = node_diff & nodes2
 
     # Compare edges
-    same_edges = edges1 == edges2
-    missing_edges = edges1 - edges2
-    extra_edges = edges2 - edges1
+    edge_diff = edges1 ^ edges2
+    same_edges = not edge_diff
+    missing_edges = edge_diff & edges1
+    extra_edges = edge_diff & edges2
 
     # Return comparison results
     return {
@@ -84,15 +95,36 @@ class TestGraphComparison(unittest.TestCase):
     to check if the graphs are the same and the code generating them is working.
     """
 
-    def setUp(self):
+    graph_gml: nx.DiGraph
+    graph_json: nx.DiGraph
+    graph_node_link: nx.DiGraph
+
+    @classmethod
+    def setUpClass(cls):
         """
-        Load graphs for testing.
+        Build the graph from the pipeline inputs, save it and load it back for testing.
 
-        This method loads graphs from GML and JSON files located in the
-        data/output directory, preparing them for comparison tests.
+        The graph is saved in each format to a temporary directory, then loaded
+        from the GML, JSON and node-link files, once for the whole test case,
+        since the tests only read them.
         """
-        self.graph_gml = load_graph_from_gml(Path("data/output/drug_mentions_graph.gml"))
-        self.graph_json = load_graph_from_json(Path("data/output/drug_mentions_graph.json"))
+        drugs = DrugExtractor(INPUT_DIR / "drugs.csv").extract()
+        pubmed = PublicationExtractor(INPUT_DIR / "pubmed.csv").extract("csv")
+        pubmed += PublicationExtractor(INPUT_DIR / "pubmed.json").extract("json")
+        clinical_trials = ClinicalTrialExtractor(INPUT_DIR / "clinical_trials.csv").extract()
+        graph = DrugMentionGraphTransformer().build_graph(drugs, pubmed, clinical_trials)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = Path(tmp_dir)
+            cls.graph_gml = load_graph_from_gml(
+                save_graph_gml(graph, output_dir / "drug_mentions_graph.gml")
+            )
+            cls.graph_json = load_graph_from_json(
+                save_graph_json(graph, output_dir / "drug_mentions_graph.json")
+            )
+            cls.graph_node_link = load_graph_from_node_link(
+                save_graph_node_link(graph, output_dir / "drug_mentions_graph.node_link.json")
+            )
 
     def test_compare_graphs_same(self):
         """
@@ -109,6 +141,24 @@ class TestGraphComparison(unittest.TestCase):
         self.assertFalse(result["missing_edges"])
         self.assertFalse(result["extra_edges"])
 
+    def test_compare_graphs_node_link(self):
+        """
+        Test that the node-link JSON file holds the same graph as the GML file.
+
+        The node-link file keeps the graph IDs and attributes as they are, so
+        the node and edge attributes are compared as well.
+        """
+        result = compare_graphs(self.graph_gml, self.graph_node_link)
+        self.assertTrue(result["same_nodes"])
+        self.assertTrue(result["same_edges"])
+        self.assertEqual(
+            dict(self.graph_gml.nodes(data=True)), dict(self.graph_node_link.nodes(data=True))
+        )
+        self.assertEqual(
+            {(u, v): d for u, v, d in self.graph_gml.edges(data=True)},
+            {(u, v): d for u, v, d in self.graph_node_link.edges(data=True)},
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
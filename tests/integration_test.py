@@ -19,16 +19,40 @@ Usage:
 # External imports
 import unittest
 from pathlib import Path
+from typing import Dict, Tuple
 
 from loguru import logger
 
 # Internal imports
 from src.models.schemas import Publication, PublicationType
-from src.pipeline.extractors import PublicationExtractor
+from src.pipeline.extractors import HAS_PYARROW, PublicationExtractor
 
 # import sys
 # sys.path.append(Path(__file__).resolve().parent)
 
+# Sample files, resolved once at import
+SAMPLE_JSON = Path(__file__).resolve().parent / "data" / "pubmed_sample.json"
+SAMPLE_JSONL = SAMPLE_JSON.with_suffix(".jsonl")
+
+# Define expected results using the Publication model, built once at import
+EXPECTED_RESULTS = (
+    Publication(
+        id="10",
+        title="Clinical implications of umbilical artery Doppler changes after betamethasone administration",
+        date="2020-01-01",
+        journal_name="The journal of maternal-fetal & neonatal medicine",
+        source_type=PublicationType.PUBMED,
+    ),
+    Publication(
+        id="11",
+        title="Effects of Topical Application of Betamethasone on Imiquimod-induced Psoriasis-like Skin Inflammation in Mice.",
+        date="2020-01-01",
+        journal_name="Journal of back and musculoskeletal rehabilitation",
+        source_type=PublicationType.PUBMED,
+    ),
+    # Add more expected results as needed
+)
+
 
 # python -m unittest tests/integration_test.py
 class TestIntegrationWithSampleData(unittest.TestCase):
@@ -40,44 +64,79 @@ class TestIntegrationWithSampleData(unittest.TestCase):
     expected Publication instances.
     """
 
+    sample_data: Tuple[Publication, ...]
+    sample_by_id: Dict[str, Publication]
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Extract the sample publication data once for the whole test case.
+
+        The extracted publications are stored as a tuple, so that the tests
+        can share them without modifying them.
+        """
+        # Load the sample data
+        logger.debug("Extracting PubMed data from JSON: {}", SAMPLE_JSON)
+        pubmed_json_extractor = PublicationExtractor(SAMPLE_JSON)
+        cls.sample_data = tuple(pubmed_json_extractor.extract("json"))
+        logger.info("Extracted {} publications", len(cls.sample_data))
+        # The publications are only formatted if a sink accepts DEBUG records
+        logger.opt(lazy=True).debug(
+            "Publications:\n{}", lambda: "\n".join(map(str, cls.sample_data))
+        )
+
+        # Index the publications by ID, so each expected result is a single lookup
+        cls.sample_by_id = {pub.id: pub for pub in cls.sample_data}
+
     def test_integration_with_sample_data(self):
         """
         Test the extraction and validation of publication data from a JSON file.
 
-        This test loads sample publication data using the PublicationExtractor,
-        logs the extracted publications, and asserts that the extracted data
-        matches the expected results defined using the Publication model.
+        This test asserts that the sample publications extracted by the
+        PublicationExtractor match the expected results defined using the
+        Publication model.
         """
-        # Load the sample data
-        path_to_json = Path(__file__).resolve().parent / "data" / "pubmed_sample.json"
-        logger.info(f"Extracting PubMed data from JSON: {path_to_json}")
-        pubmed_json_extractor = PublicationExtractor(path_to_json)
-        sample_data = pubmed_json_extractor.extract("json")
-        for pub in sample_data:
-            logger.info(f"Publication: {pub}")
-
-        # Define expected results using the Publication model
-        expected_results = [
-            Publication(
-                id="10",
-                title="Clinical implications of umbilical artery Doppler changes after betamethasone administration",
-                date="2020-01-01",
-                journal_name="The journal of maternal-fetal & neonatal medicine",
-                source_type=PublicationType.PUBMED,
-            ),
-            Publication(
-                id="11",
-                title="Effects of Topical Application of Betamethasone on Imiquimod-induced Psoriasis-like Skin Inflammation in Mice.",
-                date="2020-01-01",
-                journal_name="Journal of back and musculoskeletal rehabilitation",
-                source_type=PublicationType.PUBMED,
-            ),
-            # Add more expected results as needed
-        ]
-
-        # Perform the integration test
-        for expected in expected_results:
-            self.assertIn(expected, sample_data)
+        # Perform the integration test, reporting every mismatch in a single run
+        for expected in EXPECTED_RESULTS:
+            with self.subTest(id=expected.id):
+                self.assertEqual(self.sample_by_id.get(expected.id), expected)
+
+    def test_integration_with_sample_jsonl(self):
+        """
+        Test that the JSON Lines copy of the sample yields the same publications.
+
+        Publication equality compares every field, so the publications are
+        compared directly.
+        """
+        sample_jsonl = PublicationExtractor(SAMPLE_JSONL).extract("jsonl")
+
+        self.assertEqual(tuple(sample_jsonl), self.sample_data)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_integration_with_sample_table(self):
+        """
+        Test that the Arrow table extraction holds the same publications as the models.
+        """
+        import pyarrow.compute as pc
+
+        table = PublicationExtractor(SAMPLE_JSON).extract_table("json")
+
+        self.assertEqual(table.num_rows, len(self.sample_data))
+        for pub in self.sample_data:
+            rows = table.filter(pc.equal(table["id"], pub.id)).to_pylist()
+            with self.subTest(id=pub.id):
+                self.assertEqual(
+                    rows,
+                    [
+                        {
+                            "id": pub.id,
+                            "title": pub.title,
+                            "date": pub.date,
+                            "journal_name": pub.journal_name,
+                            "source_type": pub.source_type.value,
+                        }
+                    ],
+                )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,91 @@
+"""
+This module contains tests for the graph transformer of the pharmaceutical data pipeline.
+
+The tests build the drug mentions graph from a few drugs and publications and
+check that the parallel mention matching gives the same graph as the
+sequential one.
+
+Classes:
+    TestDrugMentionGraphTransformer: A unittest.TestCase subclass that tests
+    the mention matching of the graph transformer.
+
+Usage:
+    Run this module with unittest to execute the transformer tests.
+    Example:
+        python -m unittest tests/transformers_test.py
+"""
+
+
+# External imports
+import unittest
+
+# Internal imports
+from src.models.schemas import Drug, Publication, PublicationType
+from src.pipeline.transformers import DrugMentionGraphTransformer
+
+DRUGS = [
+    Drug(atccode="A04AD", name="DIPHENHYDRAMINE"),
+    Drug(atccode="S03AA", name="TETRACYCLINE"),
+    Drug(atccode="V03AB", name="ETHANOL"),
+    Drug(atccode="R01AD", name="BETAMETHASONE"),
+]
+
+PUBMED = [
+    Publication(
+        id=str(i),
+        title=title,
+        date=f"2020-01-{i:02d}",
+        journal_name=journal,
+        source_type=PublicationType.PUBMED,
+    )
+    for i, (title, journal) in enumerate(
+        [
+            ("A study of diphenhydramine in children", "Journal of emergency nursing"),
+            ("Tetracycline and ethanol interactions", "Psychopharmacology"),
+            ("Betamethasone after birth", "The journal of maternal-fetal medicine"),
+            ("No drug in this title", "Psychopharmacology"),
+            ("Diphenhydramine, again", "Journal of emergency nursing"),
+        ],
+        start=1,
+    )
+]
+
+CLINICAL_TRIALS = [
+    Publication(
+        id="NCT01",
+        title="Ethanol use in a clinical trial",
+        date="2020-02-01",
+        journal_name="Journal of emergency nursing",
+        source_type=PublicationType.CLINICAL_TRIAL,
+    ),
+]
+
+
+# python -m unittest tests/transformers_test.py
+class TestDrugMentionGraphTransformer(unittest.TestCase):
+    """
+    Test the mention matching of the graph transformer.
+    """
+
+    def test_parallel_matches_sequential(self):
+        """
+        Test that matching mentions in worker processes builds the same graph as in process.
+        """
+        sequential = DrugMentionGraphTransformer()
+        sequential.build_graph(DRUGS, PUBMED, CLINICAL_TRIALS)
+        # A threshold of 0 sends every publication list to the process pool
+        parallel = DrugMentionGraphTransformer(parallel_min_publications=0)
+        parallel.build_graph(DRUGS, PUBMED, CLINICAL_TRIALS)
+
+        self.assertGreater(sequential.graph.number_of_edges(), 0)
+        self.assertEqual(
+            list(parallel.graph.nodes(data=True)), list(sequential.graph.nodes(data=True))
+        )
+        self.assertEqual(
+            list(parallel.graph.edges(data=True)), list(sequential.graph.edges(data=True))
+        )
+        self.assertTrue(parallel.mentions.equals(sequential.mentions))
+
+
+if __name__ == "__main__":
+    unittest.main()